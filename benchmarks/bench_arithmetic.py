@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+
+"""Arithmetic on XndframesArray columns compared with NumPy.
+
+Usage: python benchmarks/bench_arithmetic.py [--rows N] [--repeat R]
+"""
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import operator
+import timeit
+
+import numpy as np
+
+import xndframes as xf
+
+
+def best(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10 ** 7)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(42)
+    left = rng.randint(1, 1000, args.rows).astype(np.int64)
+    right = rng.randint(1, 1000, args.rows).astype(np.int64)
+    mask = rng.rand(args.rows) < 0.1
+
+    cases = [
+        ("int64", xf.XndframesArray(left), xf.XndframesArray(right)),
+        ("?int64", xf.XndframesArray(left, mask=mask),
+         xf.XndframesArray(right, mask=mask[::-1].copy())),
+    ]
+    ops = [("+", operator.add), ("*", operator.mul),
+           ("//", operator.floordiv)]
+
+    print("{:<16} {:>12} {:>12} {:>8}".format(
+        "operation", "numpy (ms)", "xnd (ms)", "ratio"))
+    for op_name, op in ops:
+        for label, numpy_other in (("array", right), ("scalar", 3)):
+            numpy_time = best(lambda: op(left, numpy_other), args.repeat)
+            for type_name, a, b in cases:
+                other = b if label == "array" else numpy_other
+                xnd_time = best(lambda: op(a, other), args.repeat)
+                print("{:<16} {:>12.2f} {:>12.2f} {:>8.2f}".format(
+                    "{} {} {}".format(type_name, op_name, label),
+                    numpy_time * 1e3, xnd_time * 1e3,
+                    xnd_time / numpy_time))
+
+
+if __name__ == "__main__":
+    main()
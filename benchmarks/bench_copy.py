@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""Deep copy of XndframesArray columns compared with a NumPy memcpy.
+
+Usage: python benchmarks/bench_copy.py [--rows N] [--repeat R]
+"""
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import timeit
+
+import numpy as np
+from ndtypes import ndt
+
+import xndframes as xf
+
+
+def best(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def report(name, seconds, nbytes):
+    print("{:<32} {:>10.2f} ms {:>10.1f} MB/s".format(
+        name, seconds * 1e3, nbytes / seconds / 1e6))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10 ** 7)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    values = np.arange(args.rows, dtype=np.int64)
+    report("numpy int64 copy", best(values.copy, args.repeat), values.nbytes)
+
+    arr = xf.XndframesArray(values)
+    report("int64 deep copy",
+           best(lambda: arr.copy(deep=True), args.repeat), arr.nbytes)
+
+    arr = xf.XndframesArray(values, mask=values % 10 == 0)
+    report("?int64 deep copy",
+           best(lambda: arr.copy(deep=True), args.repeat), arr.nbytes)
+
+    words = np.array(["value{}".format(i % 1000) for i in range(args.rows)],
+                     dtype=object)
+    for layout in (None, "offsets", "dictionary"):
+        dtype = xf.XndframesDtype(ndt("?string"), layout=layout)
+        arr = xf.XndframesArray._from_sequence(words, dtype=dtype)
+        report("?string[{}] deep copy".format(layout or "default"),
+               best(lambda: arr.copy(deep=True), args.repeat), arr.nbytes)
+
+
+if __name__ == "__main__":
+    main()
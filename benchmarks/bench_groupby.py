@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+
+"""Grouped reductions of XndframesArray columns compared with pandas.
+
+The kernels are timed through ``_groupby_op`` with the group ids of the
+key, so the numbers do not depend on whether the installed pandas calls
+the hook (pandas >= 2.1). The request sized the frame at 100M rows; pass
+``--rows 100000000`` given enough memory.
+
+Usage: python benchmarks/bench_groupby.py [--rows N] [--groups G]
+"""
+from __future__ import absolute_import, division, print_function
+
+import argparse
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import xndframes as xf
+
+
+def best(func, repeat):
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10 ** 7)
+    parser.add_argument("--groups", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.RandomState(42)
+    ids = rng.randint(0, args.groups, args.rows).astype(np.int64)
+    values = rng.rand(args.rows)
+    mask = rng.rand(args.rows) < 0.1
+
+    frame = pd.DataFrame({"key": ids, "value": np.where(mask, np.nan, values)})
+    grouped = frame.groupby("key")["value"]
+    arr = xf.XndframesArray(values, mask=mask)
+
+    print("{:<10} {:>12} {:>12} {:>8}".format(
+        "how", "pandas (ms)", "xnd (ms)", "ratio"))
+    for how in ("sum", "mean", "min", "max", "first", "last"):
+        pandas_time = best(lambda: getattr(grouped, how)(), args.repeat)
+        xnd_time = best(
+            lambda: arr._groupby_op(
+                how=how, has_dropped_na=False, min_count=-1,
+                ngroups=args.groups, ids=ids),
+            args.repeat)
+        print("{:<10} {:>12.2f} {:>12.2f} {:>8.2f}".format(
+            how, pandas_time * 1e3, xnd_time * 1e3, xnd_time / pandas_time))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,9 @@ with open("README.md", encoding="utf-8") as readme_file:
     readme = readme_file.read()
 
 
-requirements = ["pandas>=0.23.0", "xnd"]
+requirements = ["pandas>=0.24.0", "xnd"]
+
+extras_requirements = {"gumath": ["gumath"], "parquet": ["pyarrow"]}
 
 setup_requirements = ["pytest-runner"]
 
@@ -28,6 +30,7 @@ setup(
     ],
     description="Pandas ExtensionDType/Array backed by xnd",
     install_requires=requirements,
+    extras_require=extras_requirements,
     license="BSD license",
     long_description=readme,
     long_description_content_type="text/markdown",
@@ -0,0 +1,20 @@
+import pytest
+from ndtypes import ndt
+
+import xndframes as xf
+
+
+@pytest.fixture(params=[None, "offsets", "dictionary"])
+def layout(request):
+    """
+    Storage layout of string columns, see ``XndframesDtype``.
+    """
+    return request.param
+
+
+@pytest.fixture
+def string_dtype(layout):
+    """
+    ``?string`` dtype with each storage layout.
+    """
+    return xf.XndframesDtype(ndt("?string"), layout=layout)
@@ -1,9 +1,10 @@
 # -*- coding: utf-8 -*-
 
-# import pytest
+import pytest
 import pandas as pd
 import pandas.testing as tm
 import xnd
+from ndtypes import ndt
 from pandas.core.internals import ExtensionBlock
 import numpy as np
 import xndframes as xf
@@ -86,7 +87,10 @@ def test_getitem_slice():
 def test_getitem_iterable():
     ser = pd.Series(xf.XndframesArray(TEST_ARRAY))
     result = ser[[0, 1]]
-    expected = pd.Series(xf.XndframesArray(TEST_ARRAY[0:2]), index=range(0, 2))
+    # take keeps the element type of the source, ?string
+    expected = pd.Series(
+        xf.XndframesArray(xnd.xnd(TEST_ARRAY[0:2], type="2 * ?string")),
+        index=range(0, 2))
     tm.assert_series_equal(result, expected)
 
 
@@ -106,10 +110,26 @@ def test_copy():
 def test_nbytes():
     sa = xf.XndframesArray(TEST_ARRAY)
     result = sa.nbytes
-    expected = len(TEST_ARRAY) * 8
+    # pointer slots, NUL-terminated payloads and one validity byte
+    expected = len(TEST_ARRAY) * 8 + len("Test") + len("string") + 2 + 1
     assert result == expected
 
 
+def test_memory_usage():
+    sa = xf.XndframesArray(TEST_ARRAY)
+    assert sa.memory_breakdown() == {"fixed": 24, "validity": 1, "variable": 12}
+
+    ser = pd.Series(sa)
+    assert ser.memory_usage(index=False) == 25
+    assert ser.memory_usage(index=False, deep=True) == 37
+
+    sa = xf.XndframesArray(np.arange(4, dtype="int32"))
+    assert sa.memory_breakdown() == {"fixed": 16, "validity": 0, "variable": 0}
+
+    sa = xf.XndframesArray([u"Tést", None, u""])
+    assert sa.memory_breakdown()["variable"] == 5 + 1 + 1
+
+
 def test_factorize():
     ser = pd.Series(xf.XndframesArray(TEST_ARRAY))
     labels, uniques = ser.factorize()
@@ -133,3 +153,604 @@ def test_take():
     ser = pd.Series(xf.XndframesArray(TEST_ARRAY))
     result = ser.take([0, 2, 1])
     assert isinstance(result, pd.Series)
+
+
+def test_isna_without_option_type():
+    sa = xf.XndframesArray(["a", "b", "c"])
+    np.testing.assert_array_equal(sa.isna(), np.array([False, False, False]))
+    assert sa.null_count == 0
+
+
+def test_null_count():
+    sa = xf.XndframesArray(TEST_ARRAY)
+    assert sa.null_count == 1
+    # the cached mask must not leak to callers
+    sa.isna()[:] = True
+    assert sa.null_count == 1
+    np.testing.assert_array_equal(sa.isna(), np.array([False, False, True]))
+
+
+def test_take_preserves_type():
+    sa = xf.XndframesArray(TEST_ARRAY)
+    result = sa.take([2, 0, -1])
+    assert result.dtype == sa.dtype
+    assert result.data.value == [None, "Test", None]
+
+
+def test_take_allow_fill():
+    sa = xf.XndframesArray(xnd.xnd([1, 2, 3], type="3 * int64"))
+    result = sa.take([0, -1, 2], allow_fill=True)
+    assert str(result.dtype.xnd_dtype) == "?int64"
+    assert result.data.value == [1, None, 3]
+    np.testing.assert_array_equal(result.isna(), np.array([False, True, False]))
+
+    result = sa.take([0, -1], allow_fill=True, fill_value=7)
+    assert result.dtype == sa.dtype
+    assert result.data.value == [1, 7]
+
+    with pytest.raises(ValueError):
+        sa.take([0, -2], allow_fill=True)
+    with pytest.raises(IndexError):
+        sa.take([0, 3], allow_fill=True)
+
+
+def test_take_non_option_strings():
+    sa = xf.XndframesArray(["a", "b", "c"])
+    result = sa.take([2, 0])
+    assert result.dtype == sa.dtype
+    assert result.data.value == ["c", "a"]
+
+
+def test_concat_same_type_unifies():
+    a = xf.XndframesArray(xnd.xnd([1, 2], type="2 * int64"))
+    b = xf.XndframesArray(xnd.xnd([3, None], type="2 * ?int64"))
+    result = xf.XndframesArray._concat_same_type([a, b])
+    assert str(result.dtype.xnd_dtype) == "?int64"
+    assert result.data.value == [1, 2, 3, None]
+    np.testing.assert_array_equal(
+        result.isna(), np.array([False, False, False, True]))
+
+
+def test_concat_common_dtype():
+    a = pd.Series(xf.XndframesArray(np.array([1, 2], dtype="int32")))
+    b = pd.Series(xf.XndframesArray([3, None]))
+    result = pd.concat([a, b], ignore_index=True)
+    assert result.dtype == xf.XndframesDtype(ndt("?int64"))
+    assert result.values.data.value == [1, 2, 3, None]
+
+    strings = pd.Series(xf.XndframesArray._from_sequence(
+        [u"a"], dtype="xndframes[?string, offsets]"))
+    assert pd.concat([a, strings]).dtype == np.dtype(object)
+    assert a.dtype._get_common_dtype([a.dtype, strings.dtype]) is None
+
+
+def test_constructor_numpy_zero_copy():
+    values = np.arange(5, dtype="int64")
+    sa = xf.XndframesArray(values)
+    assert str(sa.dtype.xnd_dtype) == "int64"
+    values[0] = 42
+    assert sa.data[0] == 42
+
+
+def test_constructor_numpy_mask():
+    values = np.array([1.5, 2.5, 3.5])
+    sa = xf.XndframesArray(values, mask=np.array([False, True, False]))
+    assert str(sa.dtype.xnd_dtype) == "?float64"
+    assert sa.data.value == [1.5, None, 3.5]
+    assert sa.null_count == 1
+
+    with pytest.raises(ValueError):
+        xf.XndframesArray(values, mask=np.array([True]))
+
+
+def test_getitem_boolean_mask():
+    sa = xf.XndframesArray(TEST_ARRAY)
+    result = sa[np.array([True, False, True])]
+    assert result.dtype == sa.dtype
+    assert result.data.value == ["Test", None]
+    assert result.null_count == 1
+
+    assert len(sa[np.array([False, False, False])]) == 0
+    assert sa[[True, True, True]].data.value == TEST_ARRAY
+
+    with pytest.raises(IndexError):
+        sa[np.array([True, False])]
+
+
+def test_to_numpy_numeric():
+    values = np.array([1.0, 2.0, 3.0])
+    sa = xf.XndframesArray(values)
+    result = sa.to_numpy()
+    assert result.dtype == np.float64
+    assert np.shares_memory(result, values)
+
+    sa = xf.XndframesArray(values, mask=np.array([False, True, False]))
+    np.testing.assert_array_equal(np.asarray(sa), np.array([1.0, np.nan, 3.0]))
+    result = sa.to_numpy(na_value=-1.0)
+    np.testing.assert_array_equal(result, np.array([1.0, -1.0, 3.0]))
+
+
+def test_to_numpy_string():
+    sa = xf.XndframesArray(TEST_ARRAY)
+    result = sa.to_numpy()
+    assert result.dtype == object
+    assert result.tolist() == TEST_ARRAY
+    assert sa.to_numpy(na_value="").tolist() == ["Test", "string", ""]
+
+
+def test_factorize_uniques():
+    sa = xf.XndframesArray(["b", "a", None, "b"])
+    labels, uniques = sa.factorize()
+    np.testing.assert_array_equal(labels, np.array([0, 1, -1, 0]))
+    assert labels.dtype == np.int64
+    assert uniques.dtype == sa.dtype
+    assert uniques.data.value == ["b", "a"]
+
+
+def test_factorize_numeric():
+    sa = xf.XndframesArray(
+        np.array([3, 1, 3, 2], dtype="int32"),
+        mask=np.array([False, False, False, True]))
+    labels, uniques = sa.factorize()
+    np.testing.assert_array_equal(labels, np.array([0, 1, 0, -1]))
+    assert str(uniques.dtype.xnd_dtype) == "?int32"
+    assert uniques.data.value == [3, 1]
+
+
+def test_factorize_sentinel():
+    sa = xf.XndframesArray(["b", None, "a", None])
+    labels, uniques = sa.factorize(na_sentinel=-2)
+    np.testing.assert_array_equal(labels, np.array([0, -2, 1, -2]))
+
+    labels, uniques = sa.factorize(use_na_sentinel=False)
+    np.testing.assert_array_equal(labels, np.array([0, 2, 1, 2]))
+    assert uniques.data.value == ["b", "a", None]
+
+
+def test_unique_value_counts_series():
+    ser = pd.Series(xf.XndframesArray(np.array([2, 1, 2], dtype="int64")))
+    assert ser.unique().data.value == [2, 1]
+    assert ser.nunique() == 2
+    assert ser.duplicated().tolist() == [False, False, True]
+
+
+def test_deep_copy():
+    values = np.arange(4, dtype="int64")
+    sa = xf.XndframesArray(values)
+    result = sa.copy(deep=True)
+    values[0] = 42
+    assert result.data.value == [0, 1, 2, 3]
+    assert result.dtype == sa.dtype
+
+    sa = xf.XndframesArray(TEST_ARRAY)
+    result = sa.copy(deep=True)
+    assert result.dtype == sa.dtype
+    assert result.data.value == TEST_ARRAY
+
+    values = np.arange(4, dtype="int64")
+    sa = xf.XndframesArray(values, mask=values == 1)
+    result = sa.copy()
+    values[0] = 42
+    assert result.dtype == sa.dtype
+    assert result.data.value == [0, None, 2, 3]
+    np.testing.assert_array_equal(result.isna(), sa.isna())
+
+
+def test_astype_xnd_numeric():
+    sa = xf.XndframesArray(
+        np.array([1, 2, 3], dtype="int64"), mask=np.array([False, True, False]))
+    result = sa.astype(ndt("?float64"))
+    assert isinstance(result, xf.XndframesArray)
+    assert result.data.value == [1.0, None, 3.0]
+
+    with pytest.raises(ValueError):
+        sa.astype(ndt("int64"))
+
+    sa = xf.XndframesArray(np.array([1, 300], dtype="int64"))
+    assert sa.astype(xf.XndframesDtype(ndt("?int64"))).data.value == [1, 300]
+    assert sa.astype(sa.dtype, copy=False) is sa
+    with pytest.raises(ValueError):
+        sa.astype(ndt("int8"))
+
+    sa = xf.XndframesArray(np.array([-1, 2], dtype="int64"))
+    with pytest.raises(ValueError):
+        sa.astype(ndt("uint64"))
+    with pytest.raises(ValueError):
+        xf.XndframesArray(np.array([1.5])).astype(ndt("int64"))
+
+
+def test_astype_xnd_string():
+    sa = xf.XndframesArray(["1", None, "3"])
+    result = sa.astype(ndt("?int32"))
+    assert result.data.value == [1, None, 3]
+    assert result.astype(ndt("?string")).data.value == ["1", None, "3"]
+
+    sa = xf.XndframesArray(["true", "false", None, "0", "1"])
+    result = sa.astype(ndt("?bool"))
+    assert result.data.value == [True, False, None, False, True]
+    with pytest.raises(ValueError):
+        xf.XndframesArray(["yes"]).astype(ndt("bool"))
+
+    with pytest.raises(ValueError):
+        xf.XndframesArray(["300"]).astype(ndt("int8"))
+    with pytest.raises(ValueError):
+        xf.XndframesArray._from_sequence_of_strings(["-1"], dtype="uint8")
+    with pytest.raises(ValueError):
+        xf.XndframesArray._from_sequence([1.5, None], dtype="?int64")
+
+
+def test_from_sequence_dtype():
+    result = xf.XndframesArray._from_sequence([1, None, 3], dtype="?int64")
+    assert str(result.dtype.xnd_dtype) == "?int64"
+    assert result.data.value == [1, None, 3]
+
+    result = xf.XndframesArray._from_sequence(
+        np.array([1.0, 2.0]), dtype=xf.XndframesDtype(ndt("float32")))
+    assert str(result.dtype.xnd_dtype) == "float32"
+
+    with pytest.raises(ValueError):
+        xf.XndframesArray._from_sequence([1, None], dtype="int64")
+
+
+def test_from_sequence_of_strings():
+    result = xf.XndframesArray._from_sequence_of_strings(
+        ["1.5", None, "-2"], dtype="xndframes[?float64]")
+    assert result.data.value == [1.5, None, -2.0]
+
+    result = xf.XndframesArray._from_sequence_of_strings(
+        ["True", "false", "1"], dtype="bool")
+    assert result.data.value == [True, False, True]
+
+
+def test_dtype_construct_from_string():
+    dtype = xf.XndframesDtype.construct_from_string("xndframes[?string]")
+    assert dtype == xf.XndframesArray(TEST_ARRAY).dtype
+    with pytest.raises(TypeError):
+        xf.XndframesDtype.construct_from_string("int64")
+
+
+def test_offsets_layout():
+    dtype = xf.XndframesDtype(ndt("?string"), layout="offsets")
+    assert str(dtype) == "xndframes[?string, offsets]"
+    assert xf.XndframesDtype.construct_from_string(str(dtype)) == dtype
+
+    sa = xf.XndframesArray._from_sequence(TEST_ARRAY + [u"Tést"], dtype=dtype)
+    assert sa.dtype == dtype
+    assert sa[0] == "Test"
+    assert sa[2] is None
+    assert sa[3] == u"Tést"
+    np.testing.assert_array_equal(
+        sa.isna(), np.array([False, False, True, False]))
+    assert sa.memory_breakdown()["variable"] == len(u"TeststringTést".encode())
+
+    result = sa.take([3, -1, 1], allow_fill=True)
+    assert result.dtype == dtype
+    assert result.data.value == [u"Tést", None, "string"]
+
+    labels, uniques = sa.take([0, 1, 0, 2]).factorize()
+    np.testing.assert_array_equal(labels, np.array([0, 1, 0, -1]))
+    assert uniques.dtype == dtype
+    assert uniques.data.value == ["Test", "string"]
+
+    result = xf.XndframesArray._concat_same_type([sa[:2], sa[2:]])
+    assert result.dtype == dtype
+    assert result.data.value == TEST_ARRAY + [u"Tést"]
+
+
+def test_dictionary_layout():
+    dtype = xf.XndframesDtype(ndt("?string"), layout="dictionary")
+    assert str(dtype) == "xndframes[?string, dictionary]"
+    assert xf.XndframesDtype.construct_from_string(str(dtype)) == dtype
+
+    values = [u"DE", u"FR", None, u"DE", u"FR", u"DE"]
+    sa = xf.XndframesArray._from_sequence(values, dtype=dtype)
+    assert sa.dtype == dtype
+    assert sa.dictionary.data.value == [u"DE", u"FR"]
+    assert sa[3] == u"DE"
+    assert sa[2] is None
+    np.testing.assert_array_equal(
+        sa.isna(), np.array([False, False, True, False, False, False]))
+    np.testing.assert_array_equal(
+        sa.isin([u"FR"]), np.array([False, True, False, False, True, False]))
+
+    labels, uniques = sa[1:].factorize()
+    np.testing.assert_array_equal(labels, np.array([0, -1, 1, 0, 1]))
+    assert uniques.dtype == dtype
+    assert uniques.data.value == [u"FR", u"DE"]
+
+    result = sa.take([1, -1], allow_fill=True)
+    assert result.dtype == dtype
+    assert result.data.value == [u"FR", None]
+
+
+def test_dictionary_concat_unifies():
+    dtype = xf.XndframesDtype(ndt("?string"), layout="dictionary")
+    first = xf.XndframesArray._from_sequence([u"a", u"b"], dtype=dtype)
+    second = xf.XndframesArray._from_sequence([u"c", None, u"a"], dtype=dtype)
+
+    result = xf.XndframesArray._concat_same_type([first, second])
+    assert result.dtype == dtype
+    assert result.dictionary.data.value == [u"a", u"b", u"c"]
+    assert result.data.value == [u"a", u"b", u"c", None, u"a"]
+
+    groups = pd.Series([1, 2, 3, 4, 5]).groupby(pd.Series(result)).sum()
+    assert groups.tolist() == [6, 2, 3]
+
+
+def test_reduce_numeric():
+    ser = pd.Series(xf.XndframesArray([1, 2, None, 5]))
+    assert ser.sum() == 8
+    assert ser.min() == 1
+    assert ser.max() == 5
+    assert ser.mean() == pytest.approx(8 / 3)
+    assert ser.std() == pytest.approx(np.std([1, 2, 5], ddof=1))
+    assert ser.any() and ser.all()
+    assert np.isnan(ser.sum(skipna=False))
+
+    empty = pd.Series(xf.XndframesArray._from_sequence(
+        [None, None], dtype="xndframes[?float64]"))
+    assert empty.sum() == 0
+    assert np.isnan(empty.max())
+
+
+def test_reduce_float_nan():
+    ser = pd.Series(xf.XndframesArray(np.array([1.0, np.nan, 3.0])))
+    assert ser.sum() == 4.0
+    assert ser.max() == 3.0
+    assert ser.mean() == 2.0
+    assert np.isnan(ser.sum(skipna=False))
+
+    arr = ser.values
+    ids = np.array([0, 0, 1])
+
+    def reduce(how, **kwargs):
+        return arr._groupby_op(
+            how=how, has_dropped_na=False, min_count=-1, ngroups=2, ids=ids,
+            **kwargs)
+
+    assert reduce("sum").data.value == [1.0, 3.0]
+    assert reduce("mean").data.value == [1.0, 3.0]
+    assert reduce("min").data.value == [1.0, 3.0]
+    assert reduce("max").data.value == [1.0, 3.0]
+    assert reduce("last").data.value == [1.0, 3.0]
+    assert reduce("sum", skipna=False).data.value == [None, 3.0]
+
+
+def test_reduce_strings(string_dtype):
+    ser = pd.Series(xf.XndframesArray._from_sequence(
+        [u"b", u"Tést", None, u"Test", u"ab"], dtype=string_dtype))
+    assert ser.min() == u"Test"
+    assert ser.max() == u"b"
+    assert np.isnan(ser.max(skipna=False))
+    with pytest.raises(TypeError):
+        ser.sum()
+
+
+def test_arithmetic():
+    left = pd.Series(xf.XndframesArray([1, 2, None, 4]))
+    right = pd.Series(xf.XndframesArray([10, 20, 30, None]))
+
+    result = left + right
+    assert result.dtype == xf.XndframesDtype(ndt("?int64"))
+    assert result.values.data.value == [11, 22, None, None]
+
+    result = left * 2.5
+    assert result.values.data.value == [2.5, 5.0, None, 10.0]
+
+    result = 9 // pd.Series(xf.XndframesArray([2, 4]))
+    assert result.dtype == xf.XndframesDtype(ndt("int64"))
+    assert result.values.data.value == [4, 2]
+
+    with pytest.raises(TypeError):
+        pd.Series(xf.XndframesArray(TEST_ARRAY)) - 1
+
+
+def test_arithmetic_gumath():
+    pytest.importorskip("gumath")
+    left = xf.XndframesArray([1, None, 3])
+    right = xf.XndframesArray([10, 20, None])
+
+    result = left + right
+    assert str(result.dtype.xnd_dtype) == "?int64"
+    assert result.data.value == [11, None, None]
+    assert (left * 2).data.value == [2, None, 6]
+    assert (5 - left).data.value == [4, None, 2]
+
+
+def test_arithmetic_division_by_zero():
+    arr = xf.XndframesArray(np.array([1, -2, 0]))
+    expected = (pd.Series([1, -2, 0]) // 0).tolist()
+    result = arr // 0
+    assert str(result.dtype.xnd_dtype) == "float64"
+    np.testing.assert_array_equal(result.data.value, expected)
+    np.testing.assert_array_equal(
+        (arr % 0).data.value, (pd.Series([1, -2, 0]) % 0).tolist())
+
+    quotient, remainder = divmod(xf.XndframesArray([7, None]), 0)
+    assert quotient.data.value == [np.inf, None]
+    assert np.isnan(remainder.data.value[0])
+
+    result = 6 // xf.XndframesArray(np.array([0, 4]))
+    assert result.data.value == [np.inf, 1.0]
+    assert (arr // 2).data.value == [0, -1, 0]
+
+
+def test_comparison_numeric():
+    arr = xf.XndframesArray(np.array([1, 5, 3]))
+    result = arr > 2
+    assert isinstance(result, np.ndarray)
+    np.testing.assert_array_equal(result, np.array([False, True, True]))
+    np.testing.assert_array_equal(
+        arr == xf.XndframesArray(np.array([1, 2, 3])),
+        np.array([True, False, True]))
+
+    result = xf.XndframesArray([1, None, 3]) <= 2
+    assert result.dtype == xf.XndframesDtype(ndt("?bool"))
+    assert result.data.value == [True, None, False]
+    assert arr[result].data.value == [1]
+
+
+def test_comparison_strings(string_dtype):
+    arr = xf.XndframesArray._from_sequence(
+        [u"Tést", u"b", None, u"Tést"], dtype=string_dtype)
+
+    assert (arr == u"Tést").data.value == [True, False, None, True]
+    assert (arr != u"Tést").data.value == [False, True, None, False]
+    assert (arr < u"a").data.value == [True, False, None, True]
+
+    other = xf.XndframesArray._from_sequence(
+        [u"Tést", u"a", u"c", None], dtype=string_dtype)
+    assert (arr >= other).data.value == [True, True, None, None]
+
+
+def test_argsort_numeric():
+    arr = xf.XndframesArray([3, None, 1, 2, 1])
+    np.testing.assert_array_equal(arr.argsort(), np.array([2, 4, 3, 0, 1]))
+    np.testing.assert_array_equal(
+        arr.argsort(ascending=False, na_position="first"),
+        np.array([1, 0, 3, 2, 4]))
+
+    ser = pd.Series(xf.XndframesArray(np.array([2.5, np.nan, -1.0])))
+    assert ser.sort_values().index.tolist() == [2, 0, 1]
+
+
+def test_argsort_strings(string_dtype):
+    arr = xf.XndframesArray._from_sequence(
+        [u"b", None, u"Tést", u"Test", u"b"], dtype=string_dtype)
+    result = arr.argsort()
+    assert result.dtype == np.int64
+    np.testing.assert_array_equal(result, np.array([3, 2, 0, 4, 1]))
+    assert arr.take(arr.argsort(ascending=False)).data.value == [
+        u"b", u"b", u"Tést", u"Test", None]
+
+
+def test_unique_value_counts_duplicated(string_dtype):
+    arr = xf.XndframesArray._from_sequence(
+        [u"b", u"a", None, u"b", None, u"c"], dtype=string_dtype)
+
+    result = arr.unique()
+    assert result.dtype == string_dtype
+    assert result.data.value == [u"b", u"a", None, u"c"]
+
+    counts = arr.value_counts()
+    assert counts.tolist() == [2, 1, 1]
+    assert list(counts.index) == [u"b", u"a", u"c"]
+    counts = arr.value_counts(dropna=False)
+    assert counts.tolist() == [2, 1, 1, 2]
+
+    np.testing.assert_array_equal(
+        arr.duplicated(), np.array([False, False, False, True, True, False]))
+    np.testing.assert_array_equal(
+        arr.duplicated(keep="last"),
+        np.array([True, False, True, False, False, False]))
+    np.testing.assert_array_equal(
+        arr.duplicated(keep=False),
+        np.array([True, False, True, True, True, False]))
+
+
+def test_fillna():
+    arr = xf.XndframesArray([None, 1, None, None, 4])
+
+    result = arr.fillna(0)
+    assert result.dtype == xf.XndframesDtype(ndt("int64"))
+    assert result.data.value == [0, 1, 0, 0, 4]
+
+    result = arr.fillna(xf.XndframesArray([9, 9, None, 7, 9]))
+    assert result.dtype == xf.XndframesDtype(ndt("?int64"))
+    assert result.data.value == [9, 1, None, 7, 4]
+
+    assert arr.fillna(method="ffill").data.value == [None, 1, 1, 1, 4]
+    assert arr.fillna(method="bfill", limit=1).data.value == [
+        1, 1, None, 4, 4]
+
+    result = arr.fillna(0, limit=2)
+    assert result.dtype == xf.XndframesDtype(ndt("?int64"))
+    assert result.data.value == [0, 1, 0, None, 4]
+    result = pd.Series(arr).fillna(0, limit=1)
+    assert result.values.data.value == [0, 1, None, None, 4]
+
+    with pytest.raises(ValueError):
+        arr.fillna()
+
+
+def test_fillna_dropna_where_strings(layout, string_dtype):
+    plain = xf.XndframesDtype(ndt("string"), layout=layout)
+    arr = xf.XndframesArray._from_sequence(
+        TEST_ARRAY + [u"Tést"], dtype=string_dtype)
+
+    result = arr.fillna(u"x")
+    assert result.dtype == plain
+    assert result.data.value == ["Test", "string", u"x", u"Tést"]
+    assert arr.fillna(method="pad").data.value == [
+        "Test", "string", "string", u"Tést"]
+
+    result = arr.dropna()
+    assert result.dtype == plain
+    assert result.data.value == ["Test", "string", u"Tést"]
+
+    cond = np.array([True, False, True, True])
+    assert arr.where(cond).data.value == ["Test", None, None, u"Tést"]
+    assert arr.where(cond).dtype == string_dtype
+    assert arr.mask(cond, u"y").data.value == [u"y", "string", u"y", u"y"]
+
+
+def test_groupby_op_numeric():
+    arr = xf.XndframesArray([1, None, 3, 4, 5])
+    ids = np.array([0, 0, 1, -1, 1])
+
+    def reduce(how, **kwargs):
+        return arr._groupby_op(
+            how=how, has_dropped_na=True, min_count=-1, ngroups=3, ids=ids,
+            **kwargs)
+
+    assert reduce("sum").data.value == [1, 8, 0]
+    assert reduce("mean").data.value == [1.0, 4.0, None]
+    assert reduce("min").data.value == [1, 3, None]
+    assert reduce("max").data.value == [1, 5, None]
+    assert reduce("first").data.value == [1, 3, None]
+    assert reduce("last").data.value == [1, 5, None]
+    assert reduce("sum", skipna=False).data.value == [None, 8, 0]
+
+    flags = xf.XndframesArray(np.array([True, True, False, True, True]))
+    result = flags._groupby_op(
+        how="sum", has_dropped_na=True, min_count=-1, ngroups=3, ids=ids)
+    assert str(result.dtype.xnd_dtype) == "int64"
+    assert result.data.value == [2, 1, 0]
+    result = flags._groupby_op(
+        how="min", has_dropped_na=True, min_count=-1, ngroups=3, ids=ids)
+    assert result.data.value == [True, False, None]
+
+
+def test_groupby_op_strings(layout, string_dtype):
+    arr = xf.XndframesArray._from_sequence(
+        [u"b", u"a", None, u"b", u"c"], dtype=string_dtype)
+    ids = np.array([0, 0, 0, 1, 1])
+
+    def reduce(how):
+        return arr._groupby_op(
+            how=how, has_dropped_na=False, min_count=-1, ngroups=2, ids=ids)
+
+    assert reduce("min").data.value == [u"a", u"b"]
+    assert reduce("max").data.value == [u"b", u"c"]
+    assert reduce("last").data.value == [u"a", u"c"]
+    assert reduce("min").dtype.layout == layout
+
+
+def test_groupby_agg(string_dtype):
+    df = pd.DataFrame({
+        "key": xf.XndframesArray._from_sequence(
+            [u"b", u"a", u"b", None, u"a"], dtype=string_dtype),
+        "x": xf.XndframesArray([1, 2, None, 4, 5]),
+        "s": xf.XndframesArray([u"u", u"w", u"v", u"x", None]),
+    })
+    result = df.groupby("key").agg({"x": "sum", "s": "max"})
+    assert list(result.index) == [u"a", u"b"]
+    assert list(result["x"]) == [7, 1]
+    assert list(result["s"]) == [u"w", u"v"]
+
+    grouped = df.groupby("key")["x"]
+    assert list(grouped.min()) == [2, 1]
+    assert list(grouped.max()) == [5, 1]
+    assert list(grouped.mean()) == [3.5, 1.0]
+    assert list(grouped.count()) == [2, 1]
+    assert list(df.groupby("key")["s"].nunique()) == [1, 2]
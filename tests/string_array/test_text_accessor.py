@@ -0,0 +1,151 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import xndframes as xf
+
+TEST_ARRAY = [u"Test", u"string", None, u"Tést"]
+
+
+@pytest.fixture
+def ser(string_dtype):
+    return pd.Series(
+        xf.XndframesArray._from_sequence(TEST_ARRAY, dtype=string_dtype))
+
+
+def test_accessor_requires_strings():
+    with pytest.raises(AttributeError):
+        pd.Series(xf.XndframesArray([1, 2])).text
+
+
+def test_startswith(ser):
+    result = ser.text.startswith(u"Te", na=False)
+    np.testing.assert_array_equal(
+        result, np.array([True, False, False, False]))
+
+    result = ser.text.startswith((u"s", u"Té"), na=True)
+    np.testing.assert_array_equal(result, np.array([False, True, True, True]))
+
+    result = ser.text.startswith(u"T")
+    assert str(result.dtype.xnd_dtype) == "?bool"
+    assert result.data.value == [True, False, None, True]
+
+    result = ser.text.startswith(u"T", na=np.nan)
+    assert str(result.dtype.xnd_dtype) == "?bool"
+    assert result.data.value == [True, False, None, True]
+
+
+def test_endswith(ser):
+    result = ser.text.endswith(u"st", na=False)
+    np.testing.assert_array_equal(result, np.array([True, False, False, True]))
+
+    result = ser.text.endswith((u"ing", u"ést"), na=False)
+    np.testing.assert_array_equal(result, np.array([False, True, False, True]))
+
+    result = ser.text.endswith((u"ring", u"", u"Tést!"), na=False)
+    np.testing.assert_array_equal(result, np.array([True, True, False, True]))
+
+    with pytest.raises(TypeError):
+        ser.text.endswith(1)
+
+
+def test_len(ser):
+    result = ser.text.len()
+    assert str(result.dtype.xnd_dtype) == "?int64"
+    assert result.data.value == [4, 6, None, 4]
+
+
+def test_lower_upper(ser):
+    assert ser.text.lower().data.value == [u"test", u"string", None, u"tést"]
+    assert ser.text.upper().data.value == [u"TEST", u"STRING", None, u"TÉST"]
+    assert ser.text.lower().dtype == ser.dtype
+
+
+def test_strip():
+    ser = pd.Series(xf.XndframesArray([u"  a b ", u"\tx", None, u"   "]))
+    assert ser.text.strip().data.value == [u"a b", u"x", None, u""]
+    assert ser.text.lstrip().data.value == [u"a b ", u"x", None, u""]
+    assert ser.text.rstrip(u" b").data.value == [u"  a", u"\tx", None, u""]
+
+
+def test_slice(ser):
+    assert ser.text.slice(1, 3).data.value == [u"es", u"tr", None, u"és"]
+    assert ser.text.slice(-2).data.value == [u"st", u"ng", None, u"st"]
+    assert ser.text.slice(step=2).data.value == [u"Ts", u"srn", None, u"Ts"]
+
+
+def test_contains_find(ser):
+    result = ser.text.contains(u"st", na=False)
+    np.testing.assert_array_equal(result, np.array([True, True, False, True]))
+
+    assert ser.text.find(u"st").data.value == [2, 0, None, 2]
+    assert ser.text.find(u"t", start=1).data.value == [3, 1, None, 3]
+    assert ser.text.find(u"x").data.value == [-1, -1, None, -1]
+
+
+def test_replace(ser):
+    result = ser.text.replace(u"t", u"TT")
+    assert result.data.value == [u"TesTT", u"sTTring", None, u"TésTT"]
+    result = ser.text.replace(u"é", u"e")
+    assert result.data.value == [u"Test", u"string", None, u"Test"]
+
+    ser = pd.Series(xf.XndframesArray([u"aaaa", u"abab"]))
+    assert ser.text.replace(u"aa", u"b").data.value == [u"bb", u"abab"]
+    assert ser.text.replace(u"ab", u"", n=1).data.value == [u"aaaa", u"ab"]
+
+
+def test_pad(ser):
+    assert ser.text.pad(6, fillchar=u"*").data.value == [
+        u"**Test", u"string", None, u"**Tést"]
+    assert ser.text.pad(7, side="both").data.value == [
+        u"  Test ", u" string", None, u"  Tést "]
+
+
+def test_cat(ser):
+    assert ser.text.cat(sep=u",") == u"Test,string,Tést"
+    assert ser.text.cat(sep=u",", na_rep=u"-") == u"Test,string,-,Tést"
+
+    result = ser.text.cat([u"1", u"2", u"3", u"4"], sep=u"_")
+    assert result.data.value == [u"Test_1", u"string_2", None, u"Tést_4"]
+
+
+def test_regex_contains_match(ser):
+    result = ser.text.contains(u"^[Tt].s", regex=True, na=False)
+    np.testing.assert_array_equal(result, np.array([True, False, False, True]))
+
+    result = ser.text.match(u"s|T")
+    assert result.data.value == [True, True, None, True]
+
+
+def test_regex_extract(ser):
+    result = ser.text.extract(u"(?P<head>\\w)(\\w+)t$")
+    assert list(result.columns) == ["head", 1]
+    assert result["head"].values.data.value == [u"T", None, None, u"T"]
+    assert result[1].values.data.value == [u"es", None, None, u"és"]
+
+    result = ser.text.extract(u"(ing)", expand=False)
+    assert result.data.value == [None, u"ing", None, None]
+
+    with pytest.raises(ValueError):
+        ser.text.extract(u"ing")
+
+
+def test_regex_replace(ser):
+    result = ser.text.replace(u"[aeioué]", u"_", regex=True)
+    assert result.data.value == [u"T_st", u"str_ng", None, u"T_st"]
+    result = ser.text.replace(u"(s)(t)", u"\\2\\1", n=1, regex=True)
+    assert result.data.value == [u"Tets", u"tsring", None, u"Téts"]
+
+
+def test_regex_chunks_and_threads(ser, monkeypatch):
+    monkeypatch.setattr(xf.string_array, "_CHUNK_SIZE", 1)
+    expected = ser.text.contains(u"s", regex=True, na=False)
+    result = ser.text.contains(u"s", regex=True, na=False, n_jobs=2)
+    np.testing.assert_array_equal(result, expected)
+
+    xf.string_array._compile.cache_clear()
+    ser.text.match(u"T")
+    ser.text.match(u"T")
+    assert xf.string_array._compile.cache_info().hits == 1
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+
+import numpy as np
+import pandas as pd
+
+import xndframes as xf
+
+
+def test_join_indexers(string_dtype):
+    left = [xf.XndframesArray._from_sequence(
+        [u"a", u"b", None, u"c"], dtype=string_dtype)]
+    right = [xf.XndframesArray._from_sequence(
+        [u"b", u"a", u"b", u"d", None], dtype=string_dtype)]
+
+    result = xf.join_indexers(left, right, how="inner")
+    np.testing.assert_array_equal(result[0], np.array([0, 1, 1, 2]))
+    np.testing.assert_array_equal(result[1], np.array([1, 0, 2, 4]))
+
+    result = xf.join_indexers(left, right, how="left")
+    np.testing.assert_array_equal(result[0], np.array([0, 1, 1, 2, 3]))
+    np.testing.assert_array_equal(result[1], np.array([1, 0, 2, 4, -1]))
+
+    result = xf.join_indexers(left, right, how="right")
+    np.testing.assert_array_equal(result[0], np.array([1, 0, 1, -1, 2]))
+    np.testing.assert_array_equal(result[1], np.array([0, 1, 2, 3, 4]))
+
+    result = xf.join_indexers(left, right, how="outer")
+    assert result[0].dtype == np.int64
+    np.testing.assert_array_equal(result[0], np.array([0, 1, 1, 2, 3, -1]))
+    np.testing.assert_array_equal(result[1], np.array([1, 0, 2, 4, -1, 3]))
+
+
+def test_join_indexers_multiple_keys(string_dtype):
+    left = [
+        xf.XndframesArray._from_sequence(
+            [u"a", u"a", u"b"], dtype=string_dtype),
+        xf.XndframesArray([1, 2, 1]),
+    ]
+    right = [
+        xf.XndframesArray._from_sequence(
+            [u"a", u"b", u"a"], dtype=string_dtype),
+        xf.XndframesArray([2, 1, 1]),
+    ]
+    result = xf.join_indexers(left, right)
+    np.testing.assert_array_equal(result[0], np.array([0, 1, 2]))
+    np.testing.assert_array_equal(result[1], np.array([2, 0, 1]))
+
+
+def test_merge(string_dtype):
+    left = pd.DataFrame({
+        "key": xf.XndframesArray._from_sequence(
+            [u"a", u"b", u"c"], dtype=string_dtype),
+        "value": xf.XndframesArray([1, 2, 3]),
+    })
+    right = pd.DataFrame({
+        "key": xf.XndframesArray._from_sequence(
+            [u"b", u"d"], dtype=string_dtype),
+        "value": xf.XndframesArray([20, 40]),
+    })
+
+    result = xf.merge(left, right, how="outer", on="key")
+    assert list(result.columns) == ["key", "value_x", "value_y"]
+    assert result["key"].values.data.value == [u"a", u"b", u"c", u"d"]
+    assert result["value_x"].values.data.value == [1, 2, 3, None]
+    assert result["value_y"].values.data.value == [None, 20, None, 40]
+
+
+def test_merge_numpy_keys():
+    left = pd.DataFrame({
+        "id": np.array([1, 2, 3], dtype="int64"),
+        "name": np.array([u"a", None, u"c"], dtype=object),
+        "value": xf.XndframesArray([10, 20, 30]),
+    })
+    right = pd.DataFrame({
+        "id": np.array([3, 1, 4], dtype="int64"),
+        "name": np.array([u"c", u"a", None], dtype=object),
+    })
+
+    result = xf.join_indexers([left["id"]], [right["id"]], how="left")
+    np.testing.assert_array_equal(result[0], np.array([0, 1, 2]))
+    np.testing.assert_array_equal(result[1], np.array([1, -1, 0]))
+
+    result = xf.merge(left, right, how="inner", on=["id", "name"])
+    assert result["id"].tolist() == [1, 3]
+    assert result["name"].tolist() == [u"a", u"c"]
+    assert result["value"].values.data.value == [10, 30]
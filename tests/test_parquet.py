@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import pandas as pd
+import pytest
+from ndtypes import ndt
+
+import xndframes as xf
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def df():
+    return pd.DataFrame({
+        "country": xf.XndframesArray._from_sequence(
+            [u"DE", u"FR", None, u"DE"],
+            dtype="xndframes[?string, dictionary]"),
+        "name": xf.XndframesArray._from_sequence(
+            [u"Tést", None, u"b", u""], dtype="xndframes[?string, offsets]"),
+        "plain": xf.XndframesArray([u"x", u"y", u"z", u"w"]),
+        "count": xf.XndframesArray([1, None, 3, 4]),
+        "ratio": xf.XndframesArray._from_sequence(
+            [0.5, 1.5, 2.5, 3.5], dtype="xndframes[float32]"),
+        "flag": xf.XndframesArray([True, False, None, True]),
+    })
+
+
+def test_roundtrip(df, tmpdir):
+    path = str(tmpdir.join("frame.parquet"))
+    xf.to_parquet(df, path)
+    result = xf.read_parquet(path)
+
+    assert list(result.columns) == list(df.columns)
+    for name in df.columns:
+        assert result[name].dtype == df[name].dtype
+        assert result[name].values.data.value == df[name].values.data.value
+
+
+def test_projection_and_row_groups(df, tmpdir):
+    path = str(tmpdir.join("frame.parquet"))
+    xf.to_parquet(df, path, row_group_size=2)
+
+    result = xf.read_parquet(
+        path, columns=["country", "count"], row_groups=[1])
+    assert list(result.columns) == ["country", "count"]
+    assert result["country"].values.data.value == [None, u"DE"]
+    assert result["count"].values.data.value == [3, 4]
+
+
+def test_read_plain_parquet(tmpdir):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmpdir.join("plain.parquet"))
+    pq.write_table(
+        pa.table({"a": [1, None, 3], "b": [u"x", u"y", None]}), path)
+
+    result = xf.read_parquet(path)
+    assert result["a"].dtype == xf.XndframesDtype(ndt("?int64"))
+    assert result["b"].dtype == xf.XndframesDtype(
+        ndt("?string"), layout="offsets")
+    assert result["b"].values.data.value == [u"x", u"y", None]
@@ -3,9 +3,19 @@
 """Top-level package for xndframes."""
 from .base import XndframesArray, XndframesDtype
 from ._version import get_versions
+from .join import join_indexers, merge
+from .parquet import read_parquet, to_parquet
 from .string_array import TextAccessor
 
 __version__ = get_versions()["version"]
 del get_versions
 
-__all__ = ["XndframesArray", "XndframesDtype", "TextAccessor"]
+__all__ = [
+    "XndframesArray",
+    "XndframesDtype",
+    "TextAccessor",
+    "join_indexers",
+    "merge",
+    "read_parquet",
+    "to_parquet",
+]
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+
+"""Dictionary-encoded storage for columns with few distinct strings."""
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+import pandas as pd
+from pandas.core import algorithms
+
+from ._strings import StringBuffers
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+
+def _narrow_codes(codes, size):
+    """
+    ``codes`` as int32 when a dictionary of ``size`` values allows it.
+    """
+    dtype = np.int32 if size <= _INT32_MAX else np.int64
+    return codes.astype(dtype, copy=False)
+
+
+class DictionaryBuffers(object):
+    """
+    A column of strings stored as integer codes into a dictionary of the
+    distinct values.
+
+    Parameters
+    ----------
+    codes : numpy.ndarray of int32 or int64
+        Position of each value in ``dictionary``; -1 marks missing values.
+    dictionary : StringBuffers
+        The distinct strings, without missing values. Entries that no code
+        refers to any more, e.g. after ``take``, are allowed.
+    """
+
+    layout = "dictionary"
+
+    def __init__(self, codes, dictionary):
+        self.codes = codes
+        self.dictionary = dictionary
+
+    @classmethod
+    def encode(cls, buffers):
+        """
+        Dictionary-encode StringBuffers.
+        """
+        codes, uniques = buffers.factorize()
+        return cls(_narrow_codes(codes, len(uniques)), uniques)
+
+    @classmethod
+    def missing(cls, size):
+        """
+        ``size`` missing values.
+        """
+        return cls(
+            np.full(size, -1, dtype=np.int32), StringBuffers.missing(0))
+
+    @classmethod
+    def concat(cls, to_concat):
+        """
+        Concatenate a sequence of DictionaryBuffers. Only the dictionaries
+        are compared: they are merged into one and the codes of each part
+        are remapped into it.
+        """
+        to_concat = list(to_concat)
+        mapping, dictionary = StringBuffers.concat(
+            b.dictionary for b in to_concat).factorize()
+
+        codes = []
+        start = 0
+        for buffers in to_concat:
+            valid = buffers.codes >= 0
+            remapped = np.full(len(buffers), -1, dtype=np.int64)
+            remapped[valid] = mapping[buffers.codes[valid] + start]
+            codes.append(remapped)
+            start += len(buffers.dictionary)
+
+        codes = np.concatenate(codes) if codes else np.zeros(0, np.int64)
+        return cls(_narrow_codes(codes, len(dictionary)), dictionary)
+
+    def __len__(self):
+        return len(self.codes)
+
+    @property
+    def mask(self):
+        return self.codes < 0
+
+    @property
+    def nbytes(self):
+        return self.codes.nbytes + self.dictionary.nbytes
+
+    def memory_breakdown(self):
+        """
+        Bytes used by the codes and by the dictionary.
+        """
+        return {
+            "fixed": self.codes.nbytes,
+            "validity": 0,
+            "variable": self.dictionary.nbytes,
+        }
+
+    def value(self, i):
+        """
+        The string at position ``i``, or None if it is missing.
+        """
+        code = self.codes[i]
+        if code < 0:
+            return None
+        return self.dictionary.value(code)
+
+    def to_values(self):
+        """
+        Decode into an object array of strings with None for missing values.
+        """
+        values = np.empty(len(self), dtype=object)
+        mask = self.mask
+        if len(self.dictionary):
+            values[:] = self.dictionary.to_values().take(
+                np.where(mask, 0, self.codes))
+        values[mask] = None
+        return values
+
+    def to_strings(self):
+        """
+        Decode into StringBuffers.
+        """
+        if not len(self.dictionary):
+            return StringBuffers.missing(len(self))
+        mask = self.mask
+        return self.dictionary.take(np.where(mask, 0, self.codes), fill=mask)
+
+    def take(self, indices, fill=None):
+        """
+        Gather the values at ``indices``; where the boolean array ``fill``
+        is True a missing value is produced instead.
+        """
+        codes = self.codes.take(indices)
+        if fill is not None:
+            codes[fill] = -1
+        return type(self)(codes, self.dictionary)
+
+    def compress(self, keep):
+        """
+        Select the values where the boolean array ``keep`` is True.
+        """
+        return type(self)(self.codes[keep], self.dictionary)
+
+    def copy(self):
+        return type(self)(self.codes.copy(), self.dictionary.copy())
+
+    def factorize(self):
+        """
+        Encode the values as integer codes.
+
+        Returns
+        -------
+        codes : numpy.ndarray of int64
+            -1 for missing values.
+        uniques : DictionaryBuffers
+            The distinct values in order of first appearance.
+        """
+        labels, used = pd.factorize(self.codes.astype(np.int64))
+        valid = used >= 0
+        if not valid.all():
+            # the missing code is counted as a value by pd.factorize
+            renumber = np.cumsum(valid) - 1
+            renumber[~valid] = -1
+            labels = renumber.take(labels)
+            used = used[valid]
+
+        uniques = self.dictionary.take(used)
+        return labels.astype(np.int64, copy=False), type(self)(
+            np.arange(len(used), dtype=self.codes.dtype), uniques)
+
+    def sort_keys(self):
+        """
+        The rank of each value's dictionary entry, which sorts like the
+        strings. Only the dictionary itself is sorted. Missing values get
+        rank 0.
+        """
+        order = np.argsort(self.dictionary.sort_keys(), kind="stable")
+        rank = np.empty(len(order), dtype=self.codes.dtype)
+        rank[order] = np.arange(len(order))
+        if not len(rank):
+            return np.zeros(len(self), dtype=self.codes.dtype)
+        return rank.take(np.where(self.codes < 0, 0, self.codes))
+
+    def extreme(self, name):
+        """
+        The smallest (``name="min"``) or largest (``name="max"``) valid
+        string, comparing only the dictionary entries in use.
+        """
+        used = np.unique(self.codes[self.codes >= 0])
+        return self.dictionary.take(used).extreme(name)
+
+    def compare(self, op, other):
+        """
+        ``op(string, other)`` for each string and the str ``other``. Each
+        dictionary entry is compared once and the result is looked up
+        through the codes. Missing values give False.
+        """
+        member = self.dictionary.compare(op, other)
+        mask = self.mask
+        result = np.zeros(len(self), dtype=bool)
+        if len(member):
+            result[:] = member.take(np.where(mask, 0, self.codes))
+        result[mask] = False
+        return result
+
+    def isin(self, values):
+        """
+        Whether each value is one of ``values``. Membership is tested once
+        per dictionary entry and then looked up through the codes.
+        """
+        values = list(values)
+        member = algorithms.isin(self.dictionary.to_values(), values)
+        mask = self.mask
+        result = np.zeros(len(self), dtype=bool)
+        if len(member):
+            result[:] = member.take(np.where(mask, 0, self.codes))
+        result[mask] = any(value is None or value != value
+                           for value in values)
+        return result
@@ -0,0 +1,126 @@
+# -*- coding: utf-8 -*-
+
+"""Grouped reductions over NumPy ``(values, mask)`` exports of a column.
+
+Every kernel takes the group of each row as ``ids``, an int64 array in
+which -1 marks rows that belong to no group, and the number of groups
+``ngroups``. Results have one slot per group and come with a mask that
+marks groups without a result. NaN in float values is missing, as in
+pandas.
+"""
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+
+
+def _valid_rows(mask, ids, values=None):
+    """
+    Positions of the rows that are not missing and belong to a group. NaN
+    in float ``values`` counts as missing.
+    """
+    valid = ~mask & (ids >= 0)
+    if values is not None and values.dtype.kind == "f":
+        valid &= ~np.isnan(values)
+    return np.flatnonzero(valid)
+
+
+def group_sum(values, mask, ids, ngroups, min_count=0):
+    """
+    Sum of the valid values per group, missing where a group has fewer
+    than ``min_count`` valid values. Integers are summed exactly in
+    int64 (uint64 for unsigned types), floats in float64.
+    """
+    rows = _valid_rows(mask, ids, values)
+    group_ids = ids.take(rows)
+    if values.dtype.kind == "f":
+        result = np.bincount(
+            group_ids, weights=values.take(rows), minlength=ngroups)
+    else:
+        dtype = np.uint64 if values.dtype.kind == "u" else np.int64
+        result = np.zeros(ngroups, dtype=dtype)
+        np.add.at(result, group_ids, values.take(rows).astype(dtype))
+
+    counts = np.bincount(group_ids, minlength=ngroups)
+    return result, counts < max(min_count, 0)
+
+
+def group_mean(values, mask, ids, ngroups):
+    """
+    Mean of the valid values per group, missing for empty groups.
+    """
+    rows = _valid_rows(mask, ids, values)
+    group_ids = ids.take(rows)
+    sums = np.bincount(
+        group_ids, weights=values.take(rows).astype(np.float64),
+        minlength=ngroups)
+    counts = np.bincount(group_ids, minlength=ngroups)
+    empty = counts == 0
+    with np.errstate(all="ignore"):
+        result = sums / counts
+    result[empty] = 0
+    return result, empty
+
+
+def group_extreme(values, mask, ids, ngroups, how):
+    """
+    Smallest (``how="min"``) or largest (``how="max"``) valid value per
+    group of fixed-width numeric ``values``, missing for empty groups.
+    """
+    rows = _valid_rows(mask, ids, values)
+    group_ids = ids.take(rows)
+    dtype = values.dtype
+    if dtype.kind == "f":
+        initial = np.inf if how == "min" else -np.inf
+    else:
+        info = np.iinfo(dtype)
+        initial = info.max if how == "min" else info.min
+
+    result = np.full(ngroups, initial, dtype=dtype)
+    ufunc = np.minimum if how == "min" else np.maximum
+    ufunc.at(result, group_ids, values.take(rows))
+
+    empty = np.bincount(group_ids, minlength=ngroups) == 0
+    result[empty] = 0
+    return result, empty
+
+
+def group_positions(mask, ids, ngroups, how):
+    """
+    Position of the first (``how="first"``) or last (``how="last"``)
+    valid row of each group, -1 for empty groups.
+    """
+    rows = _valid_rows(mask, ids)
+    if how == "first":
+        result = np.full(ngroups, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(result, ids.take(rows), rows)
+        result[result == np.iinfo(np.int64).max] = -1
+    else:
+        result = np.full(ngroups, -1, dtype=np.int64)
+        np.maximum.at(result, ids.take(rows), rows)
+    return result
+
+
+def group_arg_extreme(keys, mask, ids, ngroups, how):
+    """
+    Position of the first row holding the smallest (``how="min"``) or
+    largest (``how="max"``) valid value of each group, -1 for empty
+    groups. ``keys`` is any NumPy array ordering like the values, e.g.
+    the byte keys of strings; it is ranked once and the ranks are reduced
+    as integers.
+    """
+    rows = _valid_rows(mask, ids)
+    group_ids = ids.take(rows)
+    _, ranks = np.unique(keys.take(rows), return_inverse=True)
+    ranks = ranks.ravel().astype(np.int64)
+
+    if how == "min":
+        best = np.full(ngroups, np.iinfo(np.int64).max, dtype=np.int64)
+        np.minimum.at(best, group_ids, ranks)
+    else:
+        best = np.full(ngroups, -1, dtype=np.int64)
+        np.maximum.at(best, group_ids, ranks)
+
+    hit = ranks == best.take(group_ids)
+    hit_mask = np.ones(len(keys), dtype=bool)
+    hit_mask[rows[hit]] = False
+    return group_positions(hit_mask, ids, ngroups, "first")
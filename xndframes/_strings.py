@@ -0,0 +1,651 @@
+# -*- coding: utf-8 -*-
+
+"""Contiguous (Arrow-style) storage for columns of strings."""
+from __future__ import absolute_import, division, print_function
+
+import operator
+
+import numpy as np
+import pandas as pd
+
+_INT32_MAX = np.iinfo(np.int32).max
+
+# Factorizing through fixed-width keys pads every string to the longest
+# one; beyond this blow-up over the actual payload the strings are hashed
+# as Python objects instead.
+_MAX_KEY_EXPANSION = 4
+
+# The characters removed by str.strip() from ASCII strings.
+_ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+
+def _offsets_from_lengths(lengths):
+    """
+    Offsets buffer for strings of the given byte ``lengths``. The offsets
+    are int32 unless the total payload does not fit.
+    """
+    total = int(np.sum(lengths))
+    dtype = np.int32 if total <= _INT32_MAX else np.int64
+    offsets = np.zeros(len(lengths) + 1, dtype=dtype)
+    np.cumsum(lengths, dtype=dtype, out=offsets[1:])
+    return offsets
+
+
+def _has_border(needle):
+    """
+    Whether a proper prefix of ``needle`` is also a suffix of it, i.e.
+    whether occurrences of ``needle`` may overlap.
+    """
+    return any(
+        needle[:size] == needle[-size:] for size in range(1, len(needle)))
+
+
+class StringBuffers(object):
+    """
+    A column of strings stored in three contiguous buffers.
+
+    Parameters
+    ----------
+    offsets : numpy.ndarray of int32 or int64
+        ``len + 1`` positions into ``data``; string ``i`` is stored in
+        ``data[offsets[i]:offsets[i + 1]]``. ``offsets[0]`` is always 0.
+    data : numpy.ndarray of uint8
+        The UTF-8 encoded strings back to back.
+    mask : numpy.ndarray of bool
+        Marks missing values, which are stored as empty strings.
+    """
+
+    layout = "offsets"
+
+    def __init__(self, offsets, data, mask):
+        self.offsets = offsets
+        self.data = data
+        self.mask = mask
+        self._ascii = None
+
+    @classmethod
+    def from_values(cls, values, mask):
+        """
+        Encode an object array of strings, with ``mask`` marking the
+        missing slots.
+        """
+        strings = values[~mask].tolist()
+        encoded = u"".join(strings).encode("utf-8")
+        valid_lengths = np.fromiter(
+            map(len, strings), dtype=np.int64, count=len(strings))
+        if valid_lengths.sum() != len(encoded):
+            # only non-ASCII strings have more bytes than characters
+            valid_lengths = np.fromiter(
+                (len(s.encode("utf-8")) for s in strings),
+                dtype=np.int64,
+                count=len(strings))
+
+        lengths = np.zeros(len(values), dtype=np.int64)
+        lengths[~mask] = valid_lengths
+        data = np.frombuffer(encoded, dtype=np.uint8)
+        return cls(_offsets_from_lengths(lengths), data, mask.copy())
+
+    @classmethod
+    def missing(cls, size):
+        """
+        ``size`` missing values.
+        """
+        return cls(
+            np.zeros(size + 1, dtype=np.int32),
+            np.zeros(0, dtype=np.uint8),
+            np.ones(size, dtype=bool))
+
+    @classmethod
+    def concat(cls, to_concat):
+        """
+        Concatenate a sequence of StringBuffers.
+        """
+        to_concat = list(to_concat)
+        lengths = np.concatenate([b.lengths for b in to_concat])
+        return cls(
+            _offsets_from_lengths(lengths),
+            np.concatenate([b.data for b in to_concat]),
+            np.concatenate([b.mask for b in to_concat]))
+
+    def __len__(self):
+        return len(self.mask)
+
+    @property
+    def lengths(self):
+        """
+        Length of each string in bytes.
+        """
+        return np.diff(self.offsets)
+
+    @property
+    def nbytes(self):
+        return self.offsets.nbytes + self.data.nbytes + self.mask.nbytes
+
+    def memory_breakdown(self):
+        """
+        Bytes used by the offsets, the mask and the string payload.
+        """
+        return {
+            "fixed": self.offsets.nbytes,
+            "validity": self.mask.nbytes,
+            "variable": self.data.nbytes,
+        }
+
+    def value(self, i):
+        """
+        The string at position ``i``, or None if it is missing.
+        """
+        if self.mask[i]:
+            return None
+        start, stop = self.offsets[i], self.offsets[i + 1]
+        return self.data[start:stop].tobytes().decode("utf-8")
+
+    def to_values(self):
+        """
+        Decode into an object array of strings with None for missing values.
+        """
+        values = np.empty(len(self), dtype=object)
+        raw = self.data.tobytes()
+        text = raw.decode("utf-8")
+        bounds = zip(self.offsets[:-1].tolist(), self.offsets[1:].tolist())
+        if len(text) == len(raw):
+            values[:] = [text[start:stop] for start, stop in bounds]
+        else:
+            values[:] = [raw[start:stop].decode("utf-8")
+                         for start, stop in bounds]
+        values[self.mask] = None
+        return values
+
+    def take(self, indices, fill=None):
+        """
+        Gather the strings at the non-negative positions ``indices``.
+
+        The payload is gathered with one fancy-indexing pass over ``data``.
+        Output slots marked in the boolean array ``fill`` become missing.
+        """
+        starts = self.offsets[:-1].take(indices).astype(np.int64)
+        lengths = self.lengths.take(indices)
+        mask = self.mask.take(indices)
+        if fill is not None:
+            lengths[fill] = 0
+            mask[fill] = True
+
+        offsets = _offsets_from_lengths(lengths)
+        positions = np.repeat(starts - offsets[:-1], lengths)
+        positions += np.arange(offsets[-1])
+        return type(self)(offsets, self.data.take(positions), mask)
+
+    def rows(self, start, stop):
+        """
+        The strings at positions ``start:stop``, sharing ``data``.
+        """
+        offsets = self.offsets[start:stop + 1]
+        return type(self)(
+            offsets - offsets[0],
+            self.data[offsets[0]:offsets[-1]],
+            self.mask[start:stop])
+
+    def compress(self, keep):
+        """
+        Select the strings where the boolean array ``keep`` is True.
+        """
+        return self.take(np.flatnonzero(keep))
+
+    def copy(self):
+        return type(self)(
+            self.offsets.copy(), self.data.copy(), self.mask.copy())
+
+    def startswith(self, prefixes):
+        """
+        Whether each string starts with the UTF-8 encoded bytes
+        ``prefixes``, or with any of a tuple of them. Missing values give
+        False.
+        """
+        return self._match(prefixes, at_end=False)
+
+    def endswith(self, suffixes):
+        """
+        Whether each string ends with the UTF-8 encoded bytes ``suffixes``,
+        or with any of a tuple of them. Missing values give False.
+        """
+        return self._match(suffixes, at_end=True)
+
+    def _match(self, needles, at_end):
+        """
+        Whether any of the bytes ``needles`` is stored at the start (or the
+        end) of each string that is long enough to hold it.
+
+        All pairs of a string and a needle form one candidate set. Each
+        byte position is compared for all remaining pairs at once, so the
+        work shrinks with every mismatching byte and every needle is
+        matched in the same pass.
+        """
+        if isinstance(needles, bytes):
+            needles = (needles,)
+        lengths = np.array([len(n) for n in needles], dtype=np.int64)
+        table = np.zeros(
+            (len(needles), int(lengths.max(initial=0))), dtype=np.uint8)
+        for k, needle in enumerate(needles):
+            table[k, :len(needle)] = np.frombuffer(needle, dtype=np.uint8)
+
+        valid = ~self.mask
+        rows = [np.zeros(0, dtype=np.int64)]
+        ids = [np.zeros(0, dtype=np.int64)]
+        for k, length in enumerate(lengths):
+            candidates = np.flatnonzero((self.lengths >= length) & valid)
+            rows.append(candidates)
+            ids.append(np.full(len(candidates), k, dtype=np.int64))
+        rows, ids = np.concatenate(rows), np.concatenate(ids)
+        if at_end:
+            starts = self.offsets[1:].take(rows) - lengths.take(ids)
+        else:
+            starts = self.offsets[:-1].take(rows)
+        starts = starts.astype(np.int64)
+
+        for i in range(table.shape[1]):
+            pending = lengths.take(ids) > i
+            found = ~pending
+            found[pending] = self.data.take(
+                starts[pending] + i) == table[ids[pending], i]
+            rows, ids, starts = rows[found], ids[found], starts[found]
+
+        result = np.zeros(len(self), dtype=bool)
+        result[rows] = True
+        return result
+
+    @classmethod
+    def repeat(cls, pattern, counts):
+        """
+        Row ``i`` holds the UTF-8 encoded bytes ``pattern`` repeated
+        ``counts[i]`` times.
+        """
+        pattern = np.frombuffer(pattern, dtype=np.uint8)
+        counts = np.asarray(counts, dtype=np.int64)
+        return cls(
+            _offsets_from_lengths(counts * len(pattern)),
+            np.tile(pattern, int(counts.sum())),
+            np.zeros(len(counts), dtype=bool))
+
+    @classmethod
+    def concat_rows(cls, parts):
+        """
+        Row-wise concatenation of StringBuffers of equal length. A row is
+        missing if it is missing in any of the parts.
+        """
+        lengths = sum(part.lengths.astype(np.int64) for part in parts)
+        offsets = _offsets_from_lengths(lengths)
+        data = np.empty(int(offsets[-1]), dtype=np.uint8)
+
+        dest = offsets[:-1].astype(np.int64)
+        for part in parts:
+            part_lengths = part.lengths.astype(np.int64)
+            positions = np.repeat(dest - part.offsets[:-1], part_lengths)
+            positions += np.arange(len(part.data))
+            data[positions] = part.data
+            dest = dest + part_lengths
+
+        mask = np.logical_or.reduce([part.mask for part in parts])
+        result = cls(offsets, data, mask)
+        if mask.any():
+            # missing rows hold no payload
+            result = result.take(np.arange(len(mask)), fill=mask)
+        return result
+
+    def is_ascii(self):
+        """
+        Whether all strings are ASCII, in which case byte and character
+        positions coincide.
+        """
+        if self._ascii is None:
+            self._ascii = not (self.data >= 0x80).any()
+        return self._ascii
+
+    def _char_counts(self):
+        """
+        Number of characters stored before each byte position of ``data``,
+        with one extra entry for the end of the data.
+        """
+        counts = np.zeros(len(self.data) + 1, dtype=np.int64)
+        np.cumsum((self.data & 0xC0) != 0x80, out=counts[1:])
+        return counts
+
+    def char_lengths(self):
+        """
+        Length of each string in characters (Unicode code points).
+        """
+        if self.is_ascii():
+            return self.lengths.astype(np.int64)
+        counts = self._char_counts()
+        return counts.take(self.offsets[1:]) - counts.take(self.offsets[:-1])
+
+    def _byte_positions(self, chars):
+        """
+        Byte offsets within each string of the character positions
+        ``chars``, which must lie between 0 and the character length.
+        """
+        if self.is_ascii():
+            return chars
+        counts = self._char_counts()
+        char_starts = np.append(
+            np.flatnonzero((self.data & 0xC0) != 0x80), len(self.data))
+        chars_before = counts.take(self.offsets[:-1])
+        return char_starts.take(chars_before + chars) - self.offsets[:-1]
+
+    def substrings(self, starts, stops):
+        """
+        Row ``i`` holds the bytes ``starts[i]:stops[i]`` of string ``i``,
+        with positions relative to the start of each string.
+        """
+        starts = np.asarray(starts, dtype=np.int64)
+        lengths = np.maximum(np.asarray(stops, dtype=np.int64) - starts, 0)
+        lengths[self.mask] = 0
+        offsets = _offsets_from_lengths(lengths)
+        positions = np.repeat(
+            self.offsets[:-1] + starts - offsets[:-1], lengths)
+        positions += np.arange(offsets[-1])
+        return type(self)(offsets, self.data.take(positions), self.mask.copy())
+
+    def map_values(self, func):
+        """
+        Apply ``func`` to each valid value as a Python string. This is the
+        fallback for operations without a byte-level kernel.
+        """
+        values = self.to_values()
+        valid = ~self.mask
+        values[valid] = [func(value) for value in values[valid]]
+        return type(self).from_values(values, self.mask)
+
+    def _translate_ascii(self, first, last, shift):
+        """
+        Shift the bytes between ``first`` and ``last`` by ``shift``.
+        """
+        data = self.data.copy()
+        selected = (data >= ord(first)) & (data <= ord(last))
+        data[selected] = data[selected] + np.uint8(shift % 256)
+        return type(self)(self.offsets, data, self.mask)
+
+    def lower(self):
+        if not self.is_ascii():
+            return self.map_values(lambda value: value.lower())
+        return self._translate_ascii("A", "Z", 32)
+
+    def upper(self):
+        if not self.is_ascii():
+            return self.map_values(lambda value: value.upper())
+        return self._translate_ascii("a", "z", -32)
+
+    def strip(self, chars=None, side="both"):
+        """
+        Remove leading and/or trailing characters, like ``str.strip``.
+
+        Parameters
+        ----------
+        chars : str, optional
+            The characters to remove, whitespace by default.
+        side : {"both", "left", "right"}
+        """
+        if chars is None and self.is_ascii():
+            strip_bytes = _ASCII_WHITESPACE
+        elif chars is not None and all(ord(c) < 0x80 for c in chars):
+            # ASCII bytes never occur inside multi-byte UTF-8 sequences
+            strip_bytes = chars.encode("ascii")
+        else:
+            method = {"both": "strip", "left": "lstrip", "right": "rstrip"}
+            return self.map_values(
+                lambda value: getattr(value, method[side])(chars))
+
+        kept = np.flatnonzero(
+            ~np.isin(self.data, np.frombuffer(strip_bytes, dtype=np.uint8)))
+        starts = self.offsets[:-1].astype(np.int64)
+        stops = self.offsets[1:].astype(np.int64)
+
+        new_starts = starts
+        if side in ("both", "left"):
+            first = np.append(kept, len(self.data)).take(
+                np.searchsorted(kept, starts))
+            new_starts = np.minimum(first, stops)
+        new_stops = stops
+        if side in ("both", "right"):
+            last = np.insert(kept, 0, -1).take(np.searchsorted(kept, stops))
+            new_stops = np.maximum(last + 1, new_starts)
+
+        return self.substrings(new_starts - starts, new_stops - starts)
+
+    def slice(self, start=None, stop=None, step=None):
+        """
+        Slice each string by character positions, like ``value[start:stop]``.
+        """
+        if step not in (None, 1):
+            return self.map_values(lambda value: value[start:stop:step])
+
+        char_lengths = self.char_lengths()
+
+        def bound(position, default):
+            if position is None:
+                return default
+            if position < 0:
+                position = position + char_lengths
+            return np.clip(position, 0, char_lengths)
+
+        first = bound(start, np.zeros(len(self), dtype=np.int64))
+        last = np.maximum(bound(stop, char_lengths), first)
+        return self.substrings(
+            self._byte_positions(first), self._byte_positions(last))
+
+    def occurrences(self, needle):
+        """
+        Byte positions in ``data`` where the UTF-8 encoded bytes ``needle``
+        start and lie within a single string, and the rows they are in.
+        Overlapping occurrences are all reported.
+        """
+        needle = np.frombuffer(needle, dtype=np.uint8)
+        size = len(self.data) - len(needle) + 1
+        if len(needle) == 0 or size <= 0:
+            empty = np.zeros(0, dtype=np.int64)
+            return empty, empty
+
+        positions = np.flatnonzero(self.data[:size] == needle[0])
+        for i, byte in enumerate(needle[1:], 1):
+            positions = positions[self.data.take(positions + i) == byte]
+
+        rows = np.searchsorted(self.offsets, positions, side="right") - 1
+        fits = positions + len(needle) <= self.offsets.take(rows + 1)
+        return positions[fits], rows[fits]
+
+    def find(self, sub, start=0, end=None):
+        """
+        Lowest character index of ``sub`` in each string, like
+        ``str.find``; -1 where it is not found or the value is missing.
+        """
+        char_lengths = self.char_lengths()
+        first = np.where(start < 0, start + char_lengths, start)
+        first = np.maximum(first, 0)
+        last = char_lengths if end is None else np.clip(
+            np.where(end < 0, end + char_lengths, end), 0, char_lengths)
+        result = np.full(len(self), -1, dtype=np.int64)
+
+        sub_length = len(sub)
+        if sub_length == 0:
+            found = (first <= char_lengths) & (first <= last) & ~self.mask
+            result[found] = first[found]
+            return result
+
+        positions, rows = self.occurrences(sub.encode("utf-8"))
+        if self.is_ascii():
+            chars = positions - self.offsets.take(rows)
+        else:
+            counts = self._char_counts()
+            chars = counts.take(positions) - counts.take(
+                self.offsets.take(rows))
+        within = (chars >= first.take(rows)) & (
+            chars + sub_length <= last.take(rows))
+        rows, chars = rows[within], chars[within]
+
+        # occurrences are sorted, so the first one of each row is the lowest
+        found_rows, first_index = np.unique(rows, return_index=True)
+        result[found_rows] = chars.take(first_index)
+        return result
+
+    def replace(self, pat, repl, n=-1):
+        """
+        Replace occurrences of the literal string ``pat`` by ``repl``, at
+        most ``n`` per string if ``n`` is non-negative, like ``str.replace``.
+        """
+        needle = pat.encode("utf-8")
+        if len(needle) == 0 or _has_border(needle):
+            # occurrences may overlap; resolve them left to right in Python
+            return self.map_values(lambda value: value.replace(pat, repl, n))
+
+        positions, rows = self.occurrences(needle)
+        if n >= 0:
+            rank = np.arange(len(rows)) - np.searchsorted(rows, rows)
+            positions, rows = positions[rank < n], rows[rank < n]
+
+        replacement = np.frombuffer(repl.encode("utf-8"), dtype=np.uint8)
+        # output bytes contributed by each input byte: removed within an
+        # occurrence, the replacement at the start of one
+        contribution = np.ones(len(self.data), dtype=np.int64)
+        for i in range(len(needle)):
+            contribution[positions + i] = 0
+        contribution[positions] = len(replacement)
+        dest = np.zeros(len(self.data) + 1, dtype=np.int64)
+        np.cumsum(contribution, out=dest[1:])
+
+        data = np.empty(int(dest[-1]), dtype=np.uint8)
+        kept = np.ones(len(self.data), dtype=bool)
+        for i in range(len(needle)):
+            kept[positions + i] = False
+        data[dest[:-1][kept]] = self.data[kept]
+        for i, byte in enumerate(replacement):
+            data[dest.take(positions) + i] = byte
+
+        lengths = np.diff(dest.take(self.offsets))
+        return type(self)(_offsets_from_lengths(lengths), data, self.mask)
+
+    def pad(self, width, side="left", fillchar=" "):
+        """
+        Pad each string to ``width`` characters with ``fillchar``, like
+        ``str.rjust``, ``str.ljust`` and ``str.center``.
+        """
+        if len(fillchar) != 1:
+            raise TypeError("fillchar must be a character, not {!r}".format(
+                fillchar))
+
+        char_lengths = self.char_lengths()
+        margin = np.maximum(width - char_lengths, 0)
+        margin[self.mask] = 0
+        if side == "left":
+            left = margin
+        elif side == "right":
+            left = np.zeros(len(self), dtype=np.int64)
+        elif side == "both":
+            # the same split as str.center
+            left = margin // 2 + (margin & width & 1)
+        else:
+            raise ValueError("Invalid side: {!r}".format(side))
+
+        fill = fillchar.encode("utf-8")
+        cls = type(self)
+        return cls.concat_rows([
+            cls.repeat(fill, left), self, cls.repeat(fill, margin - left)])
+
+    def keys(self):
+        """
+        Fixed-width byte-string keys that are equal exactly when the
+        strings are equal: each string is NUL padded to the longest one and
+        suffixed with its length, so that embedded or trailing NULs
+        cannot collide. The keys sort like the UTF-8 bytes of the strings.
+        """
+        size = len(self)
+        lengths = self.lengths.astype(np.int64)
+        width = int(lengths.max()) if size else 0
+
+        keys = np.zeros((size, width + 8), dtype=np.uint8)
+        rows = np.repeat(np.arange(size), lengths)
+        columns = np.arange(len(self.data)) - np.repeat(
+            self.offsets[:-1].astype(np.int64), lengths)
+        keys[rows, columns] = self.data
+        keys[:, width:] = lengths.astype(">i8").view(np.uint8).reshape(size, 8)
+        return keys.view("S{}".format(width + 8)).ravel()
+
+    def _keys_fit(self):
+        """
+        Whether ``keys`` stays within a small multiple of the payload.
+        """
+        width = int(self.lengths.max()) if len(self) else 0
+        key_nbytes = len(self) * (width + 8)
+        payload_nbytes = len(self.data) + 8 * len(self)
+        return key_nbytes <= _MAX_KEY_EXPANSION * payload_nbytes
+
+    def sort_keys(self):
+        """
+        An array that sorts like the strings in UTF-8 byte order: ``keys``
+        if they stay small, otherwise the decoded strings.
+        """
+        if self._keys_fit():
+            return self.keys()
+        # code point order of decoded strings matches UTF-8 byte order
+        return self.to_values()
+
+    def extreme(self, name):
+        """
+        The smallest (``name="min"``) or largest (``name="max"``) valid
+        string in UTF-8 byte order, or None if all values are missing.
+        """
+        present = self.compress(~self.mask)
+        if not len(present):
+            return None
+        if present._keys_fit():
+            keys = present.keys()
+            return present.value(
+                keys.argmin() if name == "min" else keys.argmax())
+        # code point order of decoded strings matches UTF-8 byte order
+        strings = present.to_values().tolist()
+        return min(strings) if name == "min" else max(strings)
+
+    def compare(self, op, other):
+        """
+        ``op(string, other)`` for each string and the str ``other``, where
+        ``op`` is a comparison operator. Equality is decided on the UTF-8
+        bytes without decoding. Missing values give False.
+        """
+        if op in (operator.eq, operator.ne):
+            needle = other.encode("utf-8")
+            equal = (self.lengths == len(needle)) & self.startswith(needle)
+            return equal if op is operator.eq else ~(equal | self.mask)
+
+        valid = ~self.mask
+        result = np.zeros(len(self), dtype=bool)
+        result[valid] = op(self.compress(valid).to_values(), other)
+        return result
+
+    def factorize(self):
+        """
+        Encode the strings as integer codes.
+
+        Returns
+        -------
+        codes : numpy.ndarray of int64
+            -1 for missing values.
+        uniques : StringBuffers
+            The distinct strings in order of first appearance.
+        """
+        valid = np.flatnonzero(~self.mask)
+        codes = np.full(len(self), -1, dtype=np.int64)
+        present = self.take(valid)
+
+        if present._keys_fit():
+            _, first, inverse = np.unique(
+                present.keys(), return_index=True, return_inverse=True)
+            order = np.argsort(first, kind="mergesort")
+            rank = np.empty(len(order), dtype=np.int64)
+            rank[order] = np.arange(len(order))
+            codes[valid] = rank[inverse.ravel()]
+            uniques = present.take(first[order])
+        else:
+            codes[valid], unique_values = pd.factorize(present.to_values())
+            uniques = type(self).from_values(
+                unique_values.astype(object),
+                np.zeros(len(unique_values), dtype=bool))
+
+        return codes, uniques
@@ -1,18 +1,36 @@
 from __future__ import absolute_import, division, print_function
 
-import itertools
 from collections import Iterable
 import numpy as np
 import pandas as pd
 import six
-from pandas.api.types import is_array_like, is_bool_dtype, is_integer, is_integer_dtype
+from pandas.api.types import (
+    is_array_like,
+    is_bool_dtype,
+    is_integer,
+    is_integer_dtype,
+    is_list_like,
+    is_number,
+    is_scalar,
+)
+from pandas.core import algorithms
 from pandas.core.arrays import ExtensionArray
+from pandas.core.arrays.base import ExtensionOpsMixin
 from pandas.core.dtypes.dtypes import ExtensionDtype
 
 import ndtypes
 import xnd
 from ndtypes import ndt
 
+from . import _groupby
+from ._dictionary import DictionaryBuffers
+from ._strings import StringBuffers
+
+try:
+    import gumath.functions as gumath
+except ImportError:  # pragma: no cover
+    gumath = None
+
 _python_type_map = {
     str(ndt("int64").hidden_dtype): int,
     str(ndt("?int64").hidden_dtype): int,
@@ -20,17 +38,454 @@ _python_type_map = {
     str(ndt("?float64").hidden_dtype): float,
     str(ndt("string").hidden_dtype): six.text_type,
     str(ndt("?string").hidden_dtype): six.text_type,
+    str(ndt("bool").hidden_dtype): bool,
+    str(ndt("?bool").hidden_dtype): bool,
+    str(ndt("int8").hidden_dtype): int,
+    str(ndt("?int8").hidden_dtype): int,
+    str(ndt("int16").hidden_dtype): int,
+    str(ndt("?int16").hidden_dtype): int,
+    str(ndt("int32").hidden_dtype): int,
+    str(ndt("?int32").hidden_dtype): int,
+    str(ndt("uint8").hidden_dtype): int,
+    str(ndt("?uint8").hidden_dtype): int,
+    str(ndt("uint16").hidden_dtype): int,
+    str(ndt("?uint16").hidden_dtype): int,
+    str(ndt("uint32").hidden_dtype): int,
+    str(ndt("?uint32").hidden_dtype): int,
+    str(ndt("uint64").hidden_dtype): int,
+    str(ndt("?uint64").hidden_dtype): int,
+    str(ndt("float32").hidden_dtype): float,
+    str(ndt("?float32").hidden_dtype): float,
 }
 
+# Marks an argument that was not passed where ``None`` is a valid value.
+_no_default = object()
+
+_numpy_type_map = {
+    "bool": np.bool_,
+    "int8": np.int8,
+    "int16": np.int16,
+    "int32": np.int32,
+    "int64": np.int64,
+    "uint8": np.uint8,
+    "uint16": np.uint16,
+    "uint32": np.uint32,
+    "uint64": np.uint64,
+    "float32": np.float32,
+    "float64": np.float64,
+}
+
+# Reductions supported by XndframesArray._reduce for numeric types.
+_numeric_reductions = (
+    "sum", "prod", "mean", "min", "max", "var", "std", "any", "all")
+
+# gumath kernels of the operators where they agree with NumPy on equal
+# fixed-width element types, see ``XndframesArray._gumath_op``.
+_gumath_kernels = {"add": "add", "sub": "subtract", "mul": "multiply"}
+
+# Operators whose integer results pandas turns into floats on division by
+# zero, see ``_fill_zero_division``.
+_integer_division_ops = (
+    "floordiv", "rfloordiv", "mod", "rmod", "divmod", "rdivmod")
+
+
+def _is_option(xnd_type):
+    """
+    Whether the element type of an xnd type is an option type, i.e. whether
+    a container of that type is able to hold missing values.
+    """
+    return str(xnd_type.hidden_dtype).startswith("?")
+
+
+def _missing_mask(data):
+    """
+    Boolean NumPy array marking the missing slots of a one-dimensional
+    xnd container.
+
+    Containers whose element type is not an option type cannot hold missing
+    values, so the mask is built without reading the data. For option types
+    the values are exported from xnd in a single call and compared against
+    ``None`` in one vectorized pass.
+    """
+    size = len(data)
+    if not _is_option(data.type):
+        return np.zeros(size, dtype=bool)
+
+    values = np.empty(size, dtype=object)
+    values[:] = data.value
+    return values == None  # noqa: E711
+
+
+def _value_type(xnd_type):
+    """
+    Element type of an xnd type with the option marker stripped,
+    e.g. ``int64`` for ``3 * ?int64``.
+    """
+    return str(xnd_type.hidden_dtype).lstrip("?")
+
+
+def _numpy_dtype(xnd_type):
+    """
+    NumPy dtype holding the physical values of the element type of
+    ``xnd_type``. Variable-width types such as strings map to object.
+    """
+    return np.dtype(_numpy_type_map.get(_value_type(xnd_type), object))
+
+
+def _xnd_to_numpy(data):
+    """
+    Export a one-dimensional xnd container as a ``(values, mask)`` pair of
+    NumPy arrays.
+
+    Fixed-width types without an option type are exported zero-copy through
+    the buffer protocol. Otherwise the values are exported in one call; for
+    fixed-width option types the missing slots hold zero so that ``values``
+    keeps the native NumPy dtype.
+    """
+    dtype = _numpy_dtype(data.type)
+    if dtype != object and not _is_option(data.type):
+        values = np.asarray(memoryview(data))
+        return values, np.zeros(len(values), dtype=bool)
+
+    values = np.empty(len(data), dtype=object)
+    values[:] = data.value
+    mask = values == None  # noqa: E711
+    if dtype != object:
+        values[mask] = 0
+        values = values.astype(dtype)
+    return values, mask
+
+
+def _numpy_to_xnd(values, mask, xnd_dtype):
+    """
+    Build a one-dimensional xnd container with element type ``xnd_dtype``
+    from NumPy ``values`` and a boolean missing-value ``mask``.
+
+    Values that already have the physical layout of a fixed-width type
+    without an option type are wrapped without copying. All other inputs
+    are handed to xnd with an explicit type, so no type inference happens.
+    """
+    if mask is not None and not mask.any():
+        mask = None
+    if mask is not None and not _is_option(xnd_dtype):
+        raise ValueError(
+            "missing values require an option type, got {}".format(xnd_dtype))
+
+    if (mask is None and not _is_option(xnd_dtype) and values.dtype != object
+            and values.dtype == _numpy_dtype(xnd_dtype)):
+        return xnd.xnd.from_buffer(np.ascontiguousarray(values))
+
+    items = values.tolist()
+    if mask is not None:
+        for i in np.flatnonzero(mask):
+            items[i] = None
+    return xnd.xnd(items, type=ndt("{} * {}".format(len(items), xnd_dtype)))
+
+
+def _as_option(xnd_dtype):
+    """
+    Option version of the element type ``xnd_dtype``.
+    """
+    if _is_option(xnd_dtype):
+        return xnd_dtype
+    return ndt("?{}".format(xnd_dtype))
+
+
+def _ndarray_to_xnd(array, mask=None):
+    """
+    Build a one-dimensional xnd container from a NumPy array and an
+    optional boolean missing-value ``mask``.
+
+    Fixed-width numeric arrays map to the xnd type of the same name
+    (``?int64`` etc. when ``mask`` marks missing values) and, without
+    missing values, share memory with ``array`` unless the layout requires
+    a copy. Other arrays go through Python objects with type inference.
+    """
+    if mask is not None:
+        mask = np.asarray(mask, dtype=bool)
+        if mask.shape != array.shape:
+            raise ValueError(
+                "mask must have the same shape as the array, "
+                "got {} and {}".format(mask.shape, array.shape))
+        if not mask.any():
+            mask = None
+
+    if array.dtype.name in _numpy_type_map:
+        xnd_dtype = ndt(array.dtype.name)
+        if mask is not None:
+            xnd_dtype = _as_option(xnd_dtype)
+        array = array.astype(array.dtype.newbyteorder("="), copy=False)
+        return _numpy_to_xnd(array, mask, xnd_dtype)
+
+    items = array.tolist()
+    if mask is not None:
+        for i in np.flatnonzero(mask):
+            items[i] = None
+    return xnd.xnd(items)
+
+
+def _cast_values(values, mask, xnd_dtype):
+    """
+    Convert exported NumPy ``values`` to the physical values of the element
+    type ``xnd_dtype``; slots marked in ``mask`` are left unset.
+
+    Numeric types are cast with NumPy; a cast to an integer type must keep
+    the valid values in range and whole. Strings are parsed into int64 or
+    float64 values first, or into booleans by ``_parse_bool``, and numbers
+    are formatted as strings.
+    """
+    dtype = _numpy_dtype(xnd_dtype)
+    if dtype == object and _value_type(xnd_dtype) != "string":
+        raise TypeError("cannot cast to {}".format(xnd_dtype))
+    if values.dtype == dtype:
+        return values
+
+    valid = ~mask
+    if dtype == object:
+        result = np.empty(len(values), dtype=object)
+        result[valid] = values[valid].astype(six.text_type)
+        return result
+    if dtype == bool and values.dtype == object:
+        return _parse_bool(values, mask)
+
+    source = values[valid]
+    if source.dtype == object:
+        # Python numbers get a fixed-width dtype, strings are parsed
+        source = np.array(source.tolist())
+        if source.dtype.kind not in "biuf":
+            try:
+                source = source.astype(
+                    np.float64 if dtype.kind == "f" else np.int64)
+            except (OverflowError, TypeError, ValueError):
+                raise ValueError(
+                    "cannot parse values as {}".format(xnd_dtype))
+
+    if dtype.kind in "iu" and len(source):
+        info = np.iinfo(dtype)
+        if source.dtype.kind == "f":
+            lossless = (np.isfinite(source).all()
+                        and (np.trunc(source) == source).all())
+        else:
+            lossless = True
+        if not lossless or int(source.min()) < info.min or int(
+                source.max()) > info.max:
+            raise ValueError(
+                "cannot cast {} values to {} without loss".format(
+                    values.dtype, xnd_dtype))
+
+    result = np.zeros(len(values), dtype=dtype)
+    result[valid] = source.astype(dtype)
+    return result
+
+
+def _as_xndframes_dtype(dtype):
+    """
+    XndframesDtype given as an XndframesDtype, an ndt, or a string such as
+    ``"?int64"`` or ``"xndframes[?int64]"``.
+    """
+    if isinstance(dtype, XndframesDtype):
+        return dtype
+    if isinstance(dtype, ndtypes.ndt):
+        return XndframesDtype(dtype.hidden_dtype)
+    if isinstance(dtype, six.string_types):
+        if dtype.startswith("xndframes["):
+            return XndframesDtype.construct_from_string(dtype)
+        return XndframesDtype(ndt(dtype).hidden_dtype)
+    raise TypeError("Unsupported dtype: {!r}".format(dtype))
+
+
+def _scalars_to_numpy(scalars):
+    """
+    Convert a sequence of scalars to a ``(values, mask)`` pair of NumPy
+    arrays, where ``None`` and ``NaN`` are missing. Fixed-width NumPy
+    arrays are used as they are.
+    """
+    if isinstance(scalars, np.ndarray) and scalars.dtype.kind in "biuf":
+        values = scalars
+    else:
+        scalars = list(scalars)
+        values = np.empty(len(scalars), dtype=object)
+        values[:] = scalars
+    return values, np.asarray(pd.isna(values), dtype=bool)
+
+
+def _operand(other, size):
+    """
+    The right operand of a binary operator as a ``(values, mask)`` pair
+    that broadcasts against ``size`` values. A scalar is kept as it is
+    and a missing scalar masks every element. Sequences of Python numbers
+    are converted to a fixed-width NumPy array.
+    """
+    if isinstance(other, XndframesArray):
+        values, mask = other._values_and_mask()
+    elif is_list_like(other):
+        values, mask = _scalars_to_numpy(other)
+        if values.dtype == object and mask.all():
+            values = np.full(len(values), np.nan)
+        elif values.dtype == object:
+            filled = values.copy()
+            filled[mask] = values[~mask][0]
+            numeric = np.array(filled.tolist())
+            if numeric.dtype.kind in "biuf":
+                values = numeric
+    elif is_scalar(other) and pd.isna(other):
+        return np.nan, np.ones(size, dtype=bool)
+    else:
+        return other, np.zeros(size, dtype=bool)
+
+    if len(values) != size:
+        raise ValueError(
+            "Lengths must match: {} and {}".format(size, len(values)))
+    return values, mask
+
+
+def _with_nan(values, mask):
+    """
+    ``mask`` also marking the NaN of float ``values``. NaN in a float
+    column is missing for reductions, as for pandas, ``_sort_keys`` and
+    ``_scalars_to_numpy``.
+    """
+    if values.dtype.kind == "f":
+        return mask | np.isnan(values)
+    return mask
+
+
+def _fill_zero_division(name, result, dividend, zero):
+    """
+    Float64 copy of the integer ``result`` of the operator ``name`` where
+    the divisor is ``zero``, as pandas computes it: ``x // 0`` is ``inf``
+    with the sign of ``x`` (NaN for ``0 // 0``) and ``x % 0`` is NaN.
+    """
+    if isinstance(result, tuple):
+        # divmod and rdivmod
+        return (_fill_zero_division("floordiv", result[0], dividend, zero),
+                _fill_zero_division("mod", result[1], dividend, zero))
+
+    result = result.astype(np.float64)
+    if name.endswith("floordiv"):
+        dividend = np.broadcast_to(dividend, zero.shape)
+        with np.errstate(all="ignore"):
+            result[zero] = np.sign(
+                dividend[zero].astype(np.float64)) * np.inf
+    else:
+        result[zero] = np.nan
+    return result
+
+
+def _narrow_sort_keys(keys):
+    """
+    Integer sort ``keys`` spanning less than 2**16 values as uint16
+    offsets from their minimum, which NumPy's stable sort orders with a
+    radix sort. Other keys are returned unchanged.
+    """
+    if keys.dtype.kind not in "biu" or not len(keys):
+        return keys
+    if keys.dtype.kind == "b":
+        return keys.view(np.uint8)
+    low, high = keys.min(), keys.max()
+    if int(high) - int(low) >= 1 << 16:
+        return keys
+    if keys.dtype.itemsize < 4:
+        keys, low = keys.astype(np.int32), int(low)
+    # the difference wraps around in the key type, but its low 16 bits
+    # are exact
+    return (keys - low).astype(np.uint16)
+
+
+def _fill_indexer(mask, method, limit=None):
+    """
+    For each slot, the position of the value that ``ffill`` or ``bfill``
+    copies into it: the slot itself if it is valid, -1 if there is no
+    valid value within ``limit`` slots in the fill direction.
+    """
+    if method == "bfill":
+        indexer = _fill_indexer(mask[::-1], "ffill", limit)[::-1]
+        return np.where(indexer < 0, -1, len(mask) - 1 - indexer)
+
+    positions = np.arange(len(mask))
+    indexer = np.maximum.accumulate(np.where(mask, -1, positions))
+    if limit is not None:
+        indexer[positions - indexer > limit] = -1
+    return indexer
+
+
+def _parse_bool(values, mask):
+    """
+    Parse the strings in the object array ``values`` as booleans, accepting
+    ``true``/``false`` and ``1``/``0`` in any case.
+    """
+    result = np.zeros(len(values), dtype=bool)
+    text = np.char.lower(values[~mask].astype(six.text_type))
+    true = (text == "true") | (text == "1")
+    false = (text == "false") | (text == "0")
+    if not (true | false).all():
+        raise ValueError("cannot parse values as bool")
+    result[~mask] = true
+    return result
+
+
+def _common_xnd_dtype(xnd_dtypes):
+    """
+    Smallest element type able to hold values of all of ``xnd_dtypes``.
+
+    Fixed-width numeric types are unified with NumPy's promotion rules and
+    the result is an option type if any of the inputs is one.
+    """
+    value_types = set(_value_type(t) for t in xnd_dtypes)
+    optional = any(_is_option(t) for t in xnd_dtypes)
+
+    if len(value_types) == 1:
+        value_type = value_types.pop()
+    elif all(t in _numpy_type_map for t in value_types):
+        value_type = np.result_type(
+            *[_numpy_type_map[t] for t in value_types]).name
+    else:
+        raise TypeError(
+            "cannot find a common type for {}".format(
+                ", ".join(sorted(str(t) for t in xnd_dtypes))))
+
+    return ndt("?{}".format(value_type) if optional else value_type)
+
 
 class XndframesDtype(ExtensionDtype):
-    def __init__(self, xnd_dtype):
+    """
+    Pandas ExtensionDtype for XndframesArray.
+
+    Parameters
+    ----------
+    xnd_dtype : ndt
+        The element type, e.g. ``ndt("?string")``.
+    layout : {None, "offsets", "dictionary"}
+        How the values are stored. By default they live in an xnd
+        container. ``"offsets"`` stores strings contiguously as in Apache
+        Arrow: an int32/int64 offsets buffer, one UTF-8 data buffer and a
+        validity mask. ``"dictionary"`` stores integer codes into one
+        deduplicated copy of the distinct strings, which suits columns
+        with few distinct values.
+    """
+
+    _metadata = ("xnd_dtype", "layout")
+    _layouts = (None, "offsets", "dictionary")
+
+    def __init__(self, xnd_dtype, layout=None):
+        if layout not in self._layouts:
+            raise ValueError("Unknown layout: {!r}".format(layout))
+        if layout is not None and _value_type(xnd_dtype) != "string":
+            raise ValueError(
+                "the {} layout only supports strings, got {}".format(
+                    layout, xnd_dtype))
         self.xnd_dtype = xnd_dtype
+        self.layout = layout
 
     def __str__(self):
+        if self.layout is not None:
+            return "xndframes[{}, {}]".format(self.xnd_dtype, self.layout)
         return "xndframes[{}]".format(self.xnd_dtype)
 
     def __repr__(self):
+        if self.layout is not None:
+            return "XndframesDType({}, layout={!r})".format(
+                str(self.xnd_dtype), self.layout)
         return "XndframesDType({})".format(str(self.xnd_dtype))
 
     def __eq__(self, other):
@@ -51,11 +506,15 @@ class XndframesDtype(ExtensionDtype):
             return other == self.name
 
         elif isinstance(other, type(self)):
-            return self.xnd_dtype == other.xnd_dtype
+            return (self.xnd_dtype == other.xnd_dtype
+                    and self.layout == other.layout)
 
         else:
             return False
 
+    def __hash__(self):
+        return hash(str(self))
+
     @property
     def type(self):
         # type: () -> type
@@ -87,6 +546,56 @@ class XndframesDtype(ExtensionDtype):
         """
         return str(self)
 
+    @property
+    def _is_boolean(self):
+        """
+        Whether arrays of this type can be used as boolean masks.
+        """
+        return self.kind == "b"
+
+    def _get_common_dtype(self, dtypes):
+        """
+        Common dtype of ``dtypes``, used by ``pd.concat`` and friends.
+
+        XndframesDtypes of one layout unify their element types with
+        ``_common_xnd_dtype``; other combinations return None, which makes
+        pandas fall back to object.
+        """
+        if not all(isinstance(dtype, XndframesDtype) for dtype in dtypes):
+            return None
+        layouts = set(dtype.layout for dtype in dtypes)
+        if len(layouts) != 1:
+            return None
+        try:
+            xnd_dtype = _common_xnd_dtype(
+                [dtype.xnd_dtype for dtype in dtypes])
+        except TypeError:
+            return None
+        return XndframesDtype(xnd_dtype, layout=layouts.pop())
+
+    @classmethod
+    def construct_from_string(cls, string):
+        """
+        Construct an XndframesDtype from its name, e.g. ``xndframes[?int64]``
+        or ``xndframes[?string, offsets]``.
+
+        Raises
+        ------
+        TypeError
+            If the string is not a valid name.
+        """
+        if isinstance(string, six.string_types):
+            if string.startswith("xndframes[") and string.endswith("]"):
+                xnd_dtype, _, layout = string[len("xndframes["):-1].partition(
+                    ",")
+                try:
+                    return cls(
+                        ndt(xnd_dtype).hidden_dtype, layout.strip() or None)
+                except (TypeError, ValueError):
+                    pass
+        raise TypeError(
+            "Cannot construct a '{}' from '{}'".format(cls.__name__, string))
+
     @classmethod
     def construct_array_type(cls, *args):
         """
@@ -101,34 +610,124 @@ class XndframesDtype(ExtensionDtype):
         return XndframesArray
 
 
-class XndframesArray(ExtensionArray):
+class XndframesArray(ExtensionArray, ExtensionOpsMixin):
+    """
+    Pandas ExtensionArray backed by a one-dimensional xnd container.
+
+    Parameters
+    ----------
+    array : list, numpy.ndarray, xnd.xnd, StringBuffers or DictionaryBuffers
+        The values. Fixed-width numeric NumPy arrays are wrapped without
+        copying whenever their memory layout allows it. StringBuffers and
+        DictionaryBuffers give an array of strings with the ``offsets`` and
+        ``dictionary`` layout respectively.
+    mask : numpy.ndarray of bool, optional
+        Marks missing values of a NumPy ``array``. When any value is
+        marked, the array gets the option type, e.g. ``?float64``.
+    """
+
     _can_hold_na = True
 
-    def __init__(self, array):
+    def __init__(self, array, mask=None):
+        if mask is not None and not isinstance(array, np.ndarray):
+            raise ValueError("mask is only supported for NumPy arrays")
+
+        self._buffers = None
         if isinstance(array, list):
-            self.data = xnd.xnd(array)
+            self._data = xnd.xnd(array)
 
         elif isinstance(array, np.ndarray):
-            self.data = xnd.xnd(array.tolist())
+            self._data = _ndarray_to_xnd(array, mask)
         elif isinstance(array, xnd.xnd):
-            self.data = array
+            self._data = array
+        elif isinstance(array, (StringBuffers, DictionaryBuffers)):
+            self._data = None
+            self._buffers = array
         else:
             raise ValueError(
                 "Unsupported type passed for {}: {}".format(
-                    self.__name__, type(array)))
+                    type(self).__name__, type(array)))
 
-        self._dtype = XndframesDtype(self.data.type)
+        if self._buffers is not None:
+            self._dtype = XndframesDtype(
+                ndt("?string"), layout=self._buffers.layout)
+        else:
+            self._dtype = XndframesDtype(self._data.type.hidden_dtype)
+        self._null_mask = None
+        self._null_count = None
+        self._variable_nbytes = None
+        if mask is not None:
+            self._null_mask = np.array(mask, dtype=bool)
 
-    def __array__(self):
+    @property
+    def data(self):
+        """
+        The xnd container holding the values. With the ``offsets`` and
+        ``dictionary`` layouts it is decoded from the buffers on first
+        access.
+        """
+        if self._data is None:
+            self._data = _numpy_to_xnd(
+                self._buffers.to_values(),
+                self._buffers.mask,
+                self.dtype.xnd_dtype)
+        return self._data
+
+    def __array__(self, dtype=None):
         """
         Construct numpy arrays when passed to `np.asarray()`.
         """
-        return np.asarray(self.data)
+        return self.to_numpy(dtype=dtype)
+
+    def to_numpy(self, dtype=None, copy=False, na_value=_no_default):
+        """
+        Convert to a NumPy ndarray.
+
+        Fixed-width numeric values without missing entries are returned as
+        a view of the xnd buffer unless ``dtype`` or ``copy`` require
+        otherwise. With missing entries the values are copied once and
+        ``na_value`` is written into the missing slots.
+
+        Parameters
+        ----------
+        dtype : str or numpy.dtype, optional
+            The dtype of the result. By default the NumPy dtype of the
+            values, widened if needed to hold ``na_value``.
+        copy : bool, default False
+            Whether to ensure that the result does not share memory with
+            the array.
+        na_value : Any, optional
+            The value used for missing entries. Defaults to ``NaN`` for
+            fixed-width numeric types and ``None`` otherwise.
+
+        Returns
+        -------
+        numpy.ndarray
+        """
+        values, mask = self._values_and_mask()
+        if na_value is _no_default:
+            na_value = None if values.dtype == object else np.nan
+
+        if not mask.any():
+            if dtype is None:
+                dtype = values.dtype
+            return values.astype(dtype, copy=copy)
+
+        if dtype is None:
+            if is_number(na_value) and values.dtype != object:
+                dtype = np.result_type(values.dtype, np.asarray(na_value))
+            else:
+                dtype = object
+        result = values.astype(dtype)
+        result[mask] = na_value
+        return result
 
     def __len__(self):
         """
         Length of this array
         """
+        if self._buffers is not None:
+            return len(self._buffers)
         return len(self.data)
 
     @property
@@ -142,16 +741,97 @@ class XndframesArray(ExtensionArray):
         Return total bytes consumed by the elements of the array..
         Does not include memory consumed by non-element attributes
         of the array object.
+
+        This includes the variable-length payload of string values,
+        see ``memory_breakdown``.
+        """
+        return sum(self.memory_breakdown().values())
+
+    def memory_breakdown(self):
+        """
+        Bytes consumed by the elements of the array, by kind of storage.
+
+        Returns
+        -------
+        dict
+            * ``"fixed"``: the fixed-width slots of the elements, i.e. the
+              values of numeric types, the pointers of strings, the
+              offsets of the ``offsets`` layout or the codes of the
+              ``dictionary`` layout.
+            * ``"validity"``: the validity bitmap of option types, or the
+              mask of the ``offsets`` layout.
+            * ``"variable"``: the separately allocated payload of
+              variable-length values, including the terminating NUL byte
+              of each string. For the ``dictionary`` layout, the
+              dictionary of distinct strings.
         """
+        if self._variable_nbytes is None:
+            if self._buffers is not None:
+                self._variable_nbytes = (
+                    self._buffers.memory_breakdown()["variable"])
+            elif _numpy_dtype(self.dtype.xnd_dtype) != object:
+                self._variable_nbytes = 0
+            else:
+                values, mask = self._values_and_mask()
+                strings = values[~mask].tolist()
+                # one encoding pass, as in StringBuffers.from_values, and
+                # the terminating NUL byte of each string
+                self._variable_nbytes = len(
+                    u"".join(strings).encode("utf-8")) + len(strings)
 
-        return self.data.type.datasize
+        usage = self._shallow_breakdown()
+        usage["variable"] = self._variable_nbytes
+        return usage
+
+    def memory_usage(self, deep=False):
+        """
+        Memory usage of the values, used by ``Series.memory_usage`` and
+        ``DataFrame.info``.
+
+        Parameters
+        ----------
+        deep : bool, default False
+            Include the variable-length payload of string values, which
+            requires reading them.
+
+        Returns
+        -------
+        int
+        """
+        usage = self.memory_breakdown() if deep else self._shallow_breakdown()
+        return sum(usage.values())
+
+    def _shallow_breakdown(self):
+        """
+        ``memory_breakdown`` without the variable-length payload, which can
+        be computed without reading the values.
+        """
+        if self._buffers is not None:
+            usage = self._buffers.memory_breakdown()
+            del usage["variable"]
+            return usage
+
+        size = len(self)
+        return {
+            "fixed": size * self.data.type.hidden_dtype.datasize,
+            "validity": (size + 7) // 8 if _is_option(self.data.type) else 0,
+        }
+
+    @property
+    def null_count(self):
+        """
+        Number of missing values in the array.
+        """
+        if self._null_count is None:
+            self._null_count = int(self._get_null_mask().sum())
+        return self._null_count
 
     @property
     def size(self):
         """
         Return the number of elements in the underlying data.
         """
-        return len(self.data)
+        return len(self)
 
     @property
     def base(self):
@@ -160,6 +840,19 @@ class XndframesArray(ExtensionArray):
         """
         return self.data
 
+    @property
+    def dictionary(self):
+        """
+        The distinct strings of an array with the ``dictionary`` layout,
+        as an XndframesArray with the ``offsets`` layout. Entries may be
+        unused after selecting a subset of the array.
+        """
+        if not isinstance(self._buffers, DictionaryBuffers):
+            raise AttributeError(
+                "only arrays with the dictionary layout have a dictionary")
+        xnd_dtype = ndt(_value_type(self.dtype.xnd_dtype))
+        return self._from_buffers(self._buffers.dictionary, xnd_dtype)
+
     @classmethod
     def _concat_same_type(cls, to_concat):
         """
@@ -173,9 +866,26 @@ class XndframesArray(ExtensionArray):
         ----------
         ExtensionArray
         """
-        interim_array = [array.data for array in to_concat]
+        to_concat = list(to_concat)
+        xnd_dtype = _common_xnd_dtype(
+            [array.dtype.xnd_dtype for array in to_concat])
+
+        layouts = set(array.dtype.layout for array in to_concat)
+        if len(layouts) == 1 and None not in layouts:
+            buffers = type(to_concat[0]._buffers).concat(
+                array._buffers for array in to_concat)
+            return cls._from_buffers(buffers, xnd_dtype)
+
+        total = sum(len(array) for array in to_concat)
+        values = np.empty(total, dtype=_numpy_dtype(xnd_dtype))
+        mask = np.empty(total, dtype=bool)
+        start = 0
+        for array in to_concat:
+            stop = start + len(array)
+            values[start:stop], mask[start:stop] = array._values_and_mask()
+            start = stop
 
-        return cls(xnd.xnd(list(itertools.chain(*interim_array))))
+        return cls._from_values_and_mask(values, mask, xnd_dtype)
 
     def __getitem__(self, item):
         """Select subset of self.
@@ -201,7 +911,10 @@ class XndframesArray(ExtensionArray):
         For a boolean mask, return an instance of ``ExtensionArray``, filtered
         to the values where ``item`` is True.
         """
-        if isinstance(item, slice):
+        if isinstance(item, slice) and self._buffers is not None:
+            return self.take(np.arange(len(self))[item])
+
+        elif isinstance(item, slice):
             start = item.start or 0
             stop = item.stop if item.stop is not None else len(self.data)
             stop = min(stop, len(self.data))
@@ -209,14 +922,15 @@ class XndframesArray(ExtensionArray):
                 return type(self)(xnd.xnd([], type=self.data.type))
 
         elif isinstance(item, Iterable):
+            if isinstance(item, XndframesArray) and item.dtype._is_boolean:
+                # missing entries of a nullable mask do not select
+                item = item.to_numpy(dtype=bool, na_value=False)
             if not is_array_like(item):
                 item = np.array(item)
             if is_integer_dtype(item):
                 return self.take(item)
             elif is_bool_dtype(item):
-                indices = np.array(item)
-                indices = np.argwhere(indices).flatten()
-                return self.take(indices)
+                return self._filter(np.asarray(item, dtype=bool))
             else:
                 raise IndexError(
                     "Only integers, slices and integer or boolean \
@@ -228,6 +942,8 @@ class XndframesArray(ExtensionArray):
                 item += len(self)
             if item >= len(self):
                 return None
+            elif self._buffers is not None:
+                return self._buffers.value(item)
             else:
 
                 return self.data[item]
@@ -235,45 +951,303 @@ class XndframesArray(ExtensionArray):
         value = self.data[item]
         return type(self)(value)
 
-    def copy(self, deep=False):
+    def _filter(self, keep):
+        """
+        Select the values where the boolean NumPy array ``keep`` is True.
+        """
+        if len(keep) != len(self):
+            raise IndexError(
+                "boolean index did not match indexed array along dimension "
+                "0; dimension is {} but corresponding boolean dimension is "
+                "{}".format(len(self), len(keep)))
+
+        count = np.count_nonzero(keep)
+        if count == len(self):
+            return self.copy()
+        if self._buffers is not None:
+            return self._from_buffers(
+                self._buffers.compress(keep), self.dtype.xnd_dtype)
+        if count == 0:
+            return type(self)(
+                xnd.xnd([], type=ndt("0 * {}".format(self.dtype.xnd_dtype))))
+
+        values, mask = self._values_and_mask()
+        return self._from_values_and_mask(
+            values.compress(keep), mask.compress(keep), self.dtype.xnd_dtype)
+
+    def copy(self, deep=True):
         """
         Return a copy of the array.
 
         Parameters
         -----------
-        deep : bool, default False
-              Also copy the underlying data backing this array.
+        deep : bool, default True
+              Also copy the underlying data backing this array; pandas
+              calls ``copy()`` without arguments and expects this. The
+              xnd container is copied by xnd itself where it supports
+              ``copy_contiguous``, string buffers and fixed-width values
+              in bulk; the element type is preserved exactly.
 
         Returns
         --------
         ExtensionArray
         """
+        if deep and self._buffers is not None:
+            return self._from_buffers(
+                self._buffers.copy(), self.dtype.xnd_dtype)
+
+        if deep and hasattr(self.data, "copy_contiguous"):
+            result = type(self)(self.data.copy_contiguous())
+            if self._null_mask is not None:
+                result._null_mask = self._null_mask.copy()
+            result._null_count = self._null_count
+            return result
+
         if deep:
-            raise NotImplementedError("Deep Copy is not supported")
+            # xnd without copy_contiguous
+            values, mask = self._values_and_mask()
+            if not values.flags.owndata:
+                values = values.copy()
+            return self._from_values_and_mask(
+                values, mask.copy(), self.dtype.xnd_dtype)
+
+        if self._buffers is not None:
+            return self._from_buffers(self._buffers, self.dtype.xnd_dtype)
+
+        result = type(self)(self.data)
+        result._null_mask = self._null_mask
+        result._null_count = self._null_count
+        return result
+
+    def fillna(self, value=None, method=None, limit=None):
+        """
+        Fill missing values.
+
+        Parameters
+        ----------
+        value : scalar or array-like, optional
+            The value for the missing slots, or an array of the same
+            length, e.g. another XndframesArray, providing one value per
+            slot. Missing values of the array stay missing.
+        method : {'pad', 'ffill', 'backfill', 'bfill'}, optional
+            Propagate the last valid value forward (``pad``/``ffill``) or
+            the next one backward (``backfill``/``bfill``).
+        limit : int, optional
+            With ``method``, the maximum number of consecutive missing
+            values to fill; with ``value``, the maximum number of missing
+            values to fill, from the start.
+
+        Returns
+        -------
+        XndframesArray
+            Of the non-option type if no missing values remain.
+        """
+        if (value is None) == (method is None):
+            raise ValueError("Must specify a fill 'value' or 'method'.")
 
-        return type(self)(self.data)
+        mask = self._get_null_mask()
+        if not mask.any():
+            return self.copy()
+
+        if method is None:
+            return self._put(np.flatnonzero(mask)[:limit], value)
+
+        method = {"pad": "ffill", "backfill": "bfill"}.get(method, method)
+        if method not in ("ffill", "bfill"):
+            raise ValueError(
+                "Invalid fill method. Expecting pad (ffill) or backfill "
+                "(bfill). Got {}".format(method))
+
+        indexer = _fill_indexer(mask, method, limit)
+        fill = indexer == -1
+        xnd_dtype = self.dtype.xnd_dtype
+        if not fill.any():
+            xnd_dtype = ndt(_value_type(xnd_dtype))
+        indexer[fill] = 0
+        if self._buffers is not None:
+            return self._from_buffers(
+                self._buffers.take(indexer, fill=fill), xnd_dtype)
+
+        values = self._values_and_mask()[0]
+        return self._from_values_and_mask(
+            values.take(indexer), fill, xnd_dtype)
+
+    def dropna(self):
+        """
+        Return the valid values, selected in one pass, with the non-option
+        type.
+        """
+        mask = self._get_null_mask()
+        xnd_dtype = ndt(_value_type(self.dtype.xnd_dtype))
+        if self._buffers is not None:
+            return self._from_buffers(
+                self._buffers.compress(~mask), xnd_dtype)
+
+        values, mask = self._values_and_mask()
+        return self._from_values_and_mask(values[~mask], None, xnd_dtype)
+
+    def where(self, cond, other=None):
+        """
+        Keep the values where ``cond`` is True and replace the others.
+
+        Parameters
+        ----------
+        cond : array-like of bool
+            Same length as the array.
+        other : scalar or array-like, optional
+            The replacement, or an array of the same length providing one
+            value per slot. By default the values become missing.
+
+        Returns
+        -------
+        XndframesArray
+            Of the non-option type if there are no missing values.
+        """
+        cond = np.asarray(cond, dtype=bool)
+        if len(cond) != len(self):
+            raise ValueError("cond must have the same length as the array")
+        return self._put(np.flatnonzero(~cond), other)
+
+    def mask(self, cond, other=None):
+        """
+        Replace the values where ``cond`` is True, see ``where``.
+        """
+        return self.where(~np.asarray(cond, dtype=bool), other)
+
+    def _where(self, mask, value):
+        """
+        Analogue to ``np.where(mask, self, value)``, used by pandas.
+        """
+        return self.where(mask, value)
+
+    def _put(self, positions, other):
+        """
+        New array with the values at ``positions`` replaced by ``other``,
+        a scalar or a sequence of the length of the array. Replacements
+        are cast to the element type; missing ones leave the value missing.
+
+        The replacements are gathered into the existing storage in one
+        ``take``; for the ``offsets`` and ``dictionary`` layouts on the
+        string buffers.
+        """
+        other_values, other_mask = _operand(other, len(self))
+        filler_mask = other_mask.take(positions)
+        if np.ndim(other_values):
+            filler = np.asarray(other_values).take(positions)
+        else:
+            filler = np.repeat(np.asarray([other_values]), len(positions))
+        filler = _cast_values(filler, filler_mask, self.dtype.xnd_dtype)
+
+        xnd_dtype = ndt(_value_type(self.dtype.xnd_dtype))
+        if self._buffers is not None:
+            replacements = StringBuffers.from_values(filler, filler_mask)
+            if isinstance(self._buffers, DictionaryBuffers):
+                replacements = DictionaryBuffers.encode(replacements)
+            indices = np.arange(len(self))
+            indices[positions] = len(self) + np.arange(len(positions))
+            buffers = type(self._buffers).concat(
+                [self._buffers, replacements]).take(indices)
+            if buffers.mask.any():
+                xnd_dtype = _as_option(xnd_dtype)
+            return self._from_buffers(buffers, xnd_dtype)
+
+        values, mask = self._values_and_mask()
+        values, mask = values.copy(), mask.copy()
+        values[positions] = filler
+        mask[positions] = filler_mask
+        if mask.any():
+            xnd_dtype = _as_option(xnd_dtype)
+        return self._from_values_and_mask(values, mask, xnd_dtype)
 
     def isna(self):
         """
         Boolean NumPy array indicating if each value is missing.
         This should return a 1-D array the same length as 'self'.
         """
-        size = len(self.data)
-        isnull_byte_map = np.zeros(size, dtype=bool)
-        for i in range(size):
-            if self.data[i] is None:
-                isnull_byte_map[i] = 1
+        return self._get_null_mask().copy()
+
+    def _get_null_mask(self):
+        """
+        Cached missing-value mask of the array. Callers must not modify
+        the returned array.
+        """
+        if self._null_mask is None:
+            if self._buffers is not None:
+                self._null_mask = self._buffers.mask
+            else:
+                self._null_mask = _missing_mask(self.data)
+        return self._null_mask
+
+    def _string_buffers(self):
+        """
+        The values as StringBuffers: the storage itself for the ``offsets``
+        layout, gathered from the dictionary for the ``dictionary`` layout
+        and otherwise encoded from one bulk export.
+        """
+        if isinstance(self._buffers, DictionaryBuffers):
+            return self._buffers.to_strings()
+        if self._buffers is not None:
+            return self._buffers
+        values, mask = self._values_and_mask()
+        return StringBuffers.from_values(values, mask)
+
+    def _values_and_mask(self):
+        """
+        NumPy ``(values, mask)`` view of the array, see ``_xnd_to_numpy``.
+        Strings of the ``offsets`` and ``dictionary`` layouts are decoded
+        into an object array.
+        """
+        if self._buffers is not None:
+            return self._buffers.to_values(), self._buffers.mask
+
+        values, mask = _xnd_to_numpy(self.data)
+        if self._null_mask is None:
+            self._null_mask = mask
+        return values, self._null_mask
+
+    @classmethod
+    def _from_values_and_mask(cls, values, mask, xnd_dtype, layout=None):
+        """
+        Construct a new array of element type ``xnd_dtype`` from NumPy
+        values and a missing-value mask, keeping the mask cached.
+        """
+        if layout is not None:
+            if mask is None:
+                mask = np.zeros(len(values), dtype=bool)
+            buffers = StringBuffers.from_values(values, mask)
+            if layout == "dictionary":
+                buffers = DictionaryBuffers.encode(buffers)
+            return cls._from_buffers(buffers, xnd_dtype)
 
-        return isnull_byte_map
+        result = cls(_numpy_to_xnd(values, mask, xnd_dtype))
+        result._null_mask = mask
+        return result
+
+    @classmethod
+    def _from_buffers(cls, buffers, xnd_dtype):
+        """
+        Construct a new array from StringBuffers or DictionaryBuffers, with
+        the layout of the buffers. The element type is made an option type
+        if there are missing values.
+        """
+        mask = buffers.mask
+        if mask.any():
+            xnd_dtype = _as_option(xnd_dtype)
+        result = cls(buffers)
+        result._dtype = XndframesDtype(xnd_dtype, layout=buffers.layout)
+        result._null_mask = mask
+        return result
 
     def astype(self, dtype, copy=True):
         """
-        Cast to a NumPy array with 'dtype'
+        Cast to a NumPy array with 'dtype', or to another xnd type
 
         Parameters
         -----------
-        dtype {str or dtype} --
-                Typecode or data-type to which the array is cast
+        dtype {str, dtype, ndt or XndframesDtype} --
+                Typecode or data-type to which the array is cast.
+                An ndt or XndframesDtype casts to an XndframesArray
+                of that element type.
 
         copy {bool} -- (default: {True})
                 Whether to copy the data, even if not necessary.
@@ -282,21 +1256,47 @@ class XndframesArray(ExtensionArray):
 
         Returns
         --------
-        array: ndarray
-            NumPy ndarray with 'dtype' for its dtype.
+        array: ndarray or XndframesArray
+            NumPy ndarray with 'dtype' for its dtype, or XndframesArray
+            for xnd types.
+
+        Raises
+        ------
+        TypeError
+            When there is no cast between the xnd types.
+        ValueError
+            When values do not fit the target type, or missing values
+            would be cast to a type without option.
         """
         if isinstance(dtype, ndtypes.ndt):
-            raise NotImplementedError(
-                "cast propagation in \
-            astype not yet implemented"
-            )
+            dtype = XndframesDtype(dtype.hidden_dtype)
+
+        if isinstance(dtype, XndframesDtype):
+            return self._astype_xnd(dtype, copy=copy)
 
         else:
             dtype = np.dtype(dtype)
-            return np.asarray(self).astype(dtype)
+            return self.to_numpy(dtype=dtype, copy=copy)
+
+    def _astype_xnd(self, dtype, copy=True):
+        """
+        Cast to an XndframesArray with the XndframesDtype ``dtype``.
+        """
+        if dtype == self.dtype:
+            return self.copy(deep=True) if copy else self
+
+        xnd_dtype = dtype.xnd_dtype
+        values, mask = self._values_and_mask()
+        if mask.any() and not _is_option(xnd_dtype):
+            raise ValueError(
+                "cannot cast missing values to {}".format(xnd_dtype))
+
+        return self._from_values_and_mask(
+            _cast_values(values, mask, xnd_dtype), mask, xnd_dtype,
+            dtype.layout)
 
     @classmethod
-    def _from_sequence(cls, scalars):
+    def _from_sequence(cls, scalars, dtype=None, copy=False):
         """
         Construct a new ExtensionArray from a sequence of scalars.
 
@@ -305,12 +1305,69 @@ class XndframesArray(ExtensionArray):
         scalars: Sequence
              Each element will be an instance of the scalar type for this array
              ,``cls.dtype.type``.
+        dtype: XndframesDtype, ndt or str, optional
+             The element type of the result, e.g. ``"?int64"`` or
+             ``"xndframes[?int64]"``. When given, no type inference is done
+             and the values are converted in bulk. Missing values are
+             ``None`` or ``NaN``.
+        copy: bool, default False
+             If True, copy the underlying data.
 
         Returns
         -------
         ExtensionArray
         """
-        return cls(xnd.xnd(list(scalars)))
+        if dtype is None:
+            return cls(xnd.xnd(list(scalars)))
+
+        dtype = _as_xndframes_dtype(dtype)
+        if isinstance(scalars, cls):
+            return scalars.astype(dtype, copy=copy)
+
+        xnd_dtype = dtype.xnd_dtype
+        values, mask = _scalars_to_numpy(scalars)
+        if mask.any() and not _is_option(xnd_dtype):
+            raise ValueError(
+                "cannot store missing values as {}".format(xnd_dtype))
+        return cls._from_values_and_mask(
+            _cast_values(values, mask, xnd_dtype), mask, xnd_dtype,
+            dtype.layout)
+
+    @classmethod
+    def _from_sequence_of_strings(cls, strings, dtype=None, copy=False):
+        """
+        Construct a new ExtensionArray from a sequence of strings, e.g. the
+        text of a CSV column.
+
+        Parameters
+        ----------
+        strings: Sequence
+             Each element is a string or missing (``None`` or ``NaN``).
+        dtype: XndframesDtype, ndt or str, optional
+             The element type the text is parsed into. Defaults to
+             ``?string``.
+        copy: bool, default False
+             Unused, the strings are always parsed into new storage.
+
+        Returns
+        -------
+        ExtensionArray
+        """
+        if dtype is None:
+            dtype = XndframesDtype(ndt("?string"))
+        dtype = _as_xndframes_dtype(dtype)
+
+        xnd_dtype = dtype.xnd_dtype
+        values, mask = _scalars_to_numpy(strings)
+        if mask.any() and not _is_option(xnd_dtype):
+            raise ValueError(
+                "cannot store missing values as {}".format(xnd_dtype))
+
+        if _value_type(xnd_dtype) == "bool":
+            values = _parse_bool(values, mask)
+        return cls._from_values_and_mask(
+            _cast_values(values, mask, xnd_dtype), mask, xnd_dtype,
+            dtype.layout)
 
     def take(self, indices, allow_fill=False, fill_value=None):
         """
@@ -363,21 +1420,662 @@ class XndframesArray(ExtensionArray):
         pandas.api.extensions.take
 
         """
-        from pandas.core.algorithms import take
-
-        data = self.astype(object)
-        if allow_fill and fill_value is None:
-            fill_value = self.dtype.na_value
-        # fill value should always be translated from the scalar
-        # type for the array, to the physical storage type for
-        # the data, before passing to take.
-        result = take(
-            data,
-            indices,
-            fill_value=fill_value,
-            allow_fill=allow_fill)
-        return self._from_sequence(result)
-
-    def factorize(self, na_sentinel=-1):
-        np_array = self.__array__()
-        return pd.factorize(np_array, na_sentinel=na_sentinel)
+        indices = np.asarray(indices, dtype=np.intp)
+        if self._buffers is not None and (
+                not allow_fill or fill_value is None or pd.isna(fill_value)):
+            return self._take_buffers(indices, allow_fill)
+
+        values, mask = self._values_and_mask()
+
+        if not allow_fill:
+            return self._from_values_and_mask(
+                values.take(indices), mask.take(indices), self.dtype.xnd_dtype)
+
+        if (indices < -1).any():
+            raise ValueError(
+                "Invalid value in 'indices'. Must be between -1 "
+                "and the length of the array."
+            )
+        if (indices >= len(self)).any():
+            raise IndexError(
+                "index out of bounds for axis 0 with size {}".format(len(self)))
+
+        fill = indices == -1
+        if len(self) == 0:
+            taken = np.empty(len(indices), dtype=values.dtype)
+            taken_mask = np.ones(len(indices), dtype=bool)
+        else:
+            safe = np.where(fill, 0, indices)
+            taken = values.take(safe)
+            taken_mask = mask.take(safe)
+
+        xnd_dtype = self.dtype.xnd_dtype
+        if fill_value is None or pd.isna(fill_value):
+            taken_mask[fill] = True
+            if taken_mask.any():
+                xnd_dtype = _as_option(xnd_dtype)
+        elif fill.any():
+            taken[fill] = fill_value
+            taken_mask[fill] = False
+
+        return self._from_values_and_mask(
+            taken, taken_mask, xnd_dtype, layout=self.dtype.layout)
+
+    def _take_buffers(self, indices, allow_fill):
+        """
+        ``take`` for the ``offsets`` and ``dictionary`` layouts, gathering
+        the buffers directly. Filled slots are always missing.
+        """
+        size = len(self)
+        lowest = -1 if allow_fill else -size
+        if (indices < lowest).any() and allow_fill:
+            raise ValueError(
+                "Invalid value in 'indices'. Must be between -1 "
+                "and the length of the array."
+            )
+        if (indices < lowest).any() or (indices >= size).any():
+            raise IndexError(
+                "index out of bounds for axis 0 with size {}".format(size))
+
+        if not allow_fill:
+            indices = np.where(indices < 0, indices + size, indices)
+            buffers = self._buffers.take(indices)
+        elif size == 0:
+            buffers = type(self._buffers).missing(len(indices))
+        else:
+            fill = indices == -1
+            buffers = self._buffers.take(np.where(fill, 0, indices), fill=fill)
+
+        return self._from_buffers(buffers, self.dtype.xnd_dtype)
+
+    def _sort_keys(self):
+        """
+        ``(keys, mask)`` where ``keys`` is a NumPy array ordering like the
+        valid values and ``mask`` marks the values that sort as missing.
+        NaN counts as missing. Strings are ordered by their UTF-8 bytes.
+        """
+        if self._buffers is not None:
+            return self._buffers.sort_keys(), self._get_null_mask()
+
+        values, mask = self._values_and_mask()
+        if values.dtype.kind == "f":
+            mask = mask | np.isnan(values)
+        return values, mask
+
+    def _values_for_argsort(self):
+        """
+        Return values for sorting.
+
+        Returns
+        -------
+        ndarray
+            The transformed values should maintain the ordering between
+            values within the array.
+        """
+        return self._sort_keys()[0]
+
+    def argsort(self, ascending=True, kind="quicksort", na_position="last",
+                *args, **kwargs):
+        """
+        Return the indices that would sort this array.
+
+        Integer keys with a small range, which include the ranks of the
+        ``dictionary`` layout, are radix sorted. Missing values are not
+        compared but placed according to ``na_position``.
+
+        Parameters
+        ----------
+        ascending : bool, default True
+            Whether the indices should result in an ascending
+            or descending sort.
+        kind : {'quicksort', 'mergesort', 'heapsort'}, optional
+            Sorting algorithm.
+        na_position : {'first', 'last'}, default 'last'
+            Where to put the missing values.
+        *args, **kwargs:
+            accepted for compatibility with :func:`numpy.argsort`.
+
+        Returns
+        -------
+        numpy.ndarray of int64
+            Array of indices that sort ``self``, usable by ``take``.
+        """
+        if na_position not in ("first", "last"):
+            raise ValueError(
+                "invalid na_position: {!r}".format(na_position))
+
+        keys, mask = self._sort_keys()
+        valid = None
+        if mask.any():
+            valid = np.flatnonzero(~mask)
+            keys = keys.take(valid)
+
+        narrowed = _narrow_sort_keys(keys)
+        if narrowed is not keys:
+            keys, kind = narrowed, "stable"
+        if ascending:
+            order = np.argsort(keys, kind=kind)
+        else:
+            # sorting the reversed keys keeps equal values in their order
+            order = len(keys) - 1 - np.argsort(keys[::-1], kind=kind)[::-1]
+
+        if valid is None:
+            return order.astype(np.int64, copy=False)
+        parts = [valid.take(order), np.flatnonzero(mask)]
+        if na_position == "first":
+            parts.reverse()
+        return np.concatenate(parts).astype(np.int64, copy=False)
+
+    def _values_for_factorize(self):
+        """
+        Return an array and missing value suitable for factorization.
+
+        Returns
+        -------
+        values : ndarray
+            Fixed-width numeric values keep their native NumPy dtype as
+            long as there are no missing values.
+        na_value : object
+            The value in `values` to consider missing.
+        """
+        values = self.to_numpy()
+        na_value = np.nan if values.dtype.kind in "fO" else None
+        return values, na_value
+
+    @classmethod
+    def _from_factorized(cls, values, original):
+        """
+        Reconstruct an ExtensionArray after factorization.
+
+        Parameters
+        ----------
+        values : ndarray
+            An integer ndarray with the factorized values.
+        original : ExtensionArray
+            The original ExtensionArray that factorize was called on.
+        """
+        xnd_dtype = original.dtype.xnd_dtype
+        values = values.astype(_numpy_dtype(xnd_dtype), copy=False)
+        return cls._from_values_and_mask(values, None, xnd_dtype)
+
+    def factorize(self, na_sentinel=-1, use_na_sentinel=True):
+        """
+        Encode the array as an enumerated type.
+
+        Fixed-width numeric values are hashed in their native NumPy dtype.
+        Missing values are taken from the cached mask and never hashed.
+
+        Parameters
+        ----------
+        na_sentinel : int, default -1
+            Value to use in the `labels` array to indicate missing values.
+            Passed by pandas < 2.0.
+        use_na_sentinel : bool, default True
+            If False, missing values are encoded as one more unique value
+            instead of ``na_sentinel``. Passed by pandas >= 1.5.
+
+        Returns
+        -------
+        labels : ndarray
+            An int64 NumPy array that's an indexer into the original
+            ExtensionArray.
+        uniques : XndframesArray
+            The unique valid values, with the element type of `self`.
+        """
+        if self._buffers is not None:
+            labels, uniques = self._buffers.factorize()
+            uniques = self._from_buffers(uniques, self.dtype.xnd_dtype)
+        else:
+            values, mask = self._values_and_mask()
+            labels = np.full(len(self), -1, dtype=np.int64)
+            # pd.factorize marks NaN with -1 on every pandas version; the
+            # keyword selecting another sentinel changed in pandas 2.0
+            if mask.any():
+                labels[~mask], uniques = pd.factorize(values[~mask])
+            else:
+                labels[:], uniques = pd.factorize(values)
+            uniques = self._from_factorized(uniques, self)
+
+        missing = labels == -1
+        if missing.any():
+            if not use_na_sentinel:
+                labels[missing] = len(uniques)
+                uniques = self._concat_same_type(
+                    [uniques, self.take(np.flatnonzero(missing)[:1])])
+            elif na_sentinel != -1:
+                labels[missing] = na_sentinel
+        return labels, uniques
+
+    def unique(self):
+        """
+        Compute the ExtensionArray of unique values.
+
+        The values are hashed once by ``factorize``. A missing value is
+        kept as one more distinct value at its first appearance.
+
+        Returns
+        -------
+        uniques : XndframesArray
+            With the dtype of ``self``, or its option type.
+        """
+        labels, uniques = self.factorize()
+        missing = labels == -1
+        if not missing.any():
+            return uniques
+
+        first = int(np.argmax(missing))
+        position = int(labels[:first].max()) + 1 if first else 0
+        indices = np.insert(np.arange(len(uniques)), position, -1)
+        return uniques.take(indices, allow_fill=True)
+
+    def value_counts(self, dropna=True):
+        """
+        Return a Series containing counts of unique values.
+
+        Parameters
+        ----------
+        dropna : bool, default True
+            Don't include counts of missing values.
+
+        Returns
+        -------
+        pandas.Series
+            The counts, indexed by the distinct values in order of first
+            appearance and followed by the missing value, if counted.
+        """
+        labels, uniques = self.factorize()
+        counts = np.bincount(labels + 1, minlength=len(uniques) + 1)
+        if dropna or not counts[0]:
+            return pd.Series(counts[1:], index=uniques)
+
+        indices = np.append(np.arange(len(uniques)), -1)
+        return pd.Series(
+            np.roll(counts, -1),
+            index=uniques.take(indices, allow_fill=True))
+
+    def duplicated(self, keep="first"):
+        """
+        Boolean NumPy array marking duplicate values, computed from one
+        ``factorize`` pass. Missing values are equal to each other.
+
+        Parameters
+        ----------
+        keep : {'first', 'last', False}, default 'first'
+            Which occurrence is not marked as a duplicate; ``False`` marks
+            all of them.
+
+        Returns
+        -------
+        numpy.ndarray of bool
+        """
+        labels = self.factorize()[0] + 1
+        if keep is False:
+            counts = np.bincount(labels, minlength=1)
+            return counts.take(labels) > 1
+        if keep not in ("first", "last"):
+            raise ValueError("keep must be either 'first', 'last' or False")
+
+        if keep == "last":
+            labels = labels[::-1]
+        _, first = np.unique(labels, return_index=True)
+        result = np.ones(len(self), dtype=bool)
+        result[first] = False
+        return result if keep == "first" else result[::-1]
+
+    def isin(self, values):
+        """
+        Whether each element is contained in ``values``.
+
+        With the ``dictionary`` layout only the distinct strings are
+        compared and the result is looked up through the codes.
+
+        Parameters
+        ----------
+        values : list-like
+            The values to look for. Missing values match missing elements.
+
+        Returns
+        -------
+        numpy.ndarray of bool
+        """
+        if isinstance(self._buffers, DictionaryBuffers):
+            return self._buffers.isin(values)
+
+        values = list(values)
+        own, mask = self._values_and_mask()
+        result = np.zeros(len(self), dtype=bool)
+        valid = ~mask
+        result[valid] = algorithms.isin(own[valid], values)
+        result[mask] = any(pd.isna(value) for value in values)
+        return result
+
+    def _reduce(self, name, skipna=True, **kwargs):
+        """
+        Return a scalar result of performing the reduction operation.
+
+        Numeric reductions run as one NumPy kernel over the valid values,
+        which are the xnd buffer itself when nothing is missing; NaN in
+        float columns counts as missing. Strings
+        support ``min`` and ``max`` in UTF-8 byte order.
+
+        Parameters
+        ----------
+        name : str
+            Name of the function, one of ``sum``, ``prod``, ``mean``,
+            ``min``, ``max``, ``var``, ``std``, ``any`` and ``all``.
+        skipna : bool, default True
+            If True, skip missing values. Otherwise a missing value makes
+            the result missing, except where ``any`` and ``all`` are
+            decided by the valid values alone.
+        **kwargs
+            ``min_count`` for ``sum`` and ``prod``, ``ddof`` for ``var``
+            and ``std``.
+
+        Returns
+        -------
+        scalar
+            ``NaN`` if the result is missing.
+
+        Raises
+        ------
+        TypeError
+            If the reduction is not supported for the element type.
+        """
+        if _numpy_dtype(self.dtype.xnd_dtype) == object:
+            return self._reduce_strings(name, skipna)
+        if name not in _numeric_reductions:
+            raise TypeError(
+                "cannot perform {} with type {}".format(name, self.dtype))
+
+        values, mask = self._values_and_mask()
+        mask = _with_nan(values, mask)
+        missing = bool(mask.any())
+        if missing:
+            if not skipna and name not in ("any", "all"):
+                return np.nan
+            values = values[~mask]
+
+        if name in ("any", "all"):
+            result = bool(getattr(values, name)())
+            if missing and not skipna and result == (name == "all"):
+                return np.nan
+            return result
+
+        if name in ("sum", "prod"):
+            if len(values) < kwargs.get("min_count", 0):
+                return np.nan
+            return getattr(values, name)()
+
+        if name in ("var", "std"):
+            ddof = kwargs.get("ddof", 1)
+            if len(values) <= ddof:
+                return np.nan
+            return getattr(values, name)(ddof=ddof)
+
+        if not len(values):
+            return np.nan
+        return getattr(values, name)()
+
+    def _reduce_strings(self, name, skipna):
+        """
+        ``min`` and ``max`` of string values, see ``_reduce``.
+        """
+        if name not in ("min", "max") or (
+                _value_type(self.dtype.xnd_dtype) != "string"):
+            raise TypeError(
+                "cannot perform {} with type {}".format(name, self.dtype))
+        if not skipna and self.null_count:
+            return np.nan
+
+        if self._buffers is not None:
+            result = self._buffers.extreme(name)
+        else:
+            values, mask = self._values_and_mask()
+            strings = values[~mask].tolist()
+            result = None
+            if strings:
+                result = min(strings) if name == "min" else max(strings)
+        return np.nan if result is None else result
+
+    @classmethod
+    def _create_arithmetic_method(cls, op):
+        """
+        The arithmetic dunder method for the binary operator ``op``, used by
+        ``ExtensionOpsMixin._add_arithmetic_ops``.
+        """
+        def arithmetic_method(self, other):
+            if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+                # let pandas align and unbox the operand
+                return NotImplemented
+            return self._arithmetic_op(op, other)
+
+        arithmetic_method.__name__ = "__{}__".format(op.__name__.strip("_"))
+        return arithmetic_method
+
+    def _arithmetic_op(self, op, other):
+        """
+        Apply ``op`` to the fixed-width values of the array and ``other``.
+
+        ``+``, ``-`` and ``*`` run as gumath kernels on the xnd containers
+        when possible, see ``_gumath_op``. Otherwise both operands are
+        exported once as NumPy ``(values, mask)`` pairs, the operator runs
+        as one vectorized kernel and the result is missing wherever either
+        operand is missing.
+        """
+        result = self._gumath_op(op, other)
+        if result is not None:
+            return result
+
+        values, mask = self._values_and_mask()
+        other_values, other_mask = _operand(other, len(self))
+        for operand in (values, other_values):
+            if np.asarray(operand).dtype.kind not in "biuf":
+                raise TypeError(
+                    "unsupported operand type(s) for {}: '{}' and '{}'".format(
+                        op.__name__, self.dtype, type(other).__name__))
+
+        with np.errstate(all="ignore"):
+            result = op(values, other_values)
+        mask = mask | other_mask
+
+        name = op.__name__.strip("_")
+        if (name in _integer_division_ops
+                and np.result_type(values, other_values).kind in "biu"):
+            dividend, divisor = values, other_values
+            if name.startswith("r"):
+                dividend, divisor = divisor, dividend
+            zero = np.broadcast_to(np.asarray(divisor) == 0, mask.shape)
+            if (zero & ~mask).any():
+                result = _fill_zero_division(name, result, dividend, zero)
+
+        if isinstance(result, tuple):
+            # divmod and rdivmod
+            return tuple(self._from_result(part, mask) for part in result)
+        return self._from_result(result, mask)
+
+    def _gumath_op(self, op, other):
+        """
+        Apply ``op`` with a gumath kernel directly to the xnd containers,
+        including option types, without exporting the values.
+
+        Returns None when gumath is not installed, ``op`` has no kernel in
+        ``_gumath_kernels``, or ``other`` is not an XndframesArray or a
+        Python number of the same fixed-width element type. Results keep
+        the element type of the operands, also when no value is missing.
+        """
+        name = op.__name__.strip("_")
+        reflected = name.startswith("r")
+        kernel = _gumath_kernels.get(name[1:] if reflected else name)
+        if gumath is None or kernel is None or self._buffers is not None:
+            return None
+        value_type = _value_type(self.dtype.xnd_dtype)
+        if value_type not in _numpy_type_map or value_type == "bool":
+            return None
+
+        try:
+            if isinstance(other, XndframesArray):
+                if (other._buffers is not None or _value_type(
+                        other.dtype.xnd_dtype) != value_type):
+                    return None
+                other = other.data
+            elif isinstance(other, (six.integer_types, float)) and not \
+                    isinstance(other, bool):
+                other = xnd.xnd(other)
+                if str(other.type) != value_type:
+                    return None
+            else:
+                return None
+
+            left, right = self.data, other
+            if reflected:
+                left, right = right, left
+            return type(self)(getattr(gumath, kernel)(left, right))
+        except (TypeError, ValueError):
+            # no kernel for these operands; the NumPy path decides
+            return None
+
+    @classmethod
+    def _from_result(cls, values, mask):
+        """
+        Construct a new array from the NumPy result of an operator. The
+        element type follows the NumPy dtype and is an option type only
+        if there are missing values.
+        """
+        if values.dtype.name not in _numpy_type_map:
+            raise TypeError(
+                "unsupported result dtype: {}".format(values.dtype))
+        xnd_dtype = ndt(values.dtype.name)
+        if mask.any():
+            xnd_dtype = _as_option(xnd_dtype)
+        return cls._from_values_and_mask(values, mask, xnd_dtype)
+
+    @classmethod
+    def _create_comparison_method(cls, op):
+        """
+        The comparison dunder method for the operator ``op``, used by
+        ``ExtensionOpsMixin._add_comparison_ops``.
+        """
+        def comparison_method(self, other):
+            if isinstance(other, (pd.Series, pd.Index, pd.DataFrame)):
+                return NotImplemented
+            return self._comparison_op(op, other)
+
+        comparison_method.__name__ = "__{}__".format(op.__name__)
+        return comparison_method
+
+    def _comparison_op(self, op, other):
+        """
+        Compare the array with ``other`` element-wise.
+
+        The comparison runs as one vectorized kernel over the valid values.
+        Strings of the ``offsets`` and ``dictionary`` layouts compared
+        with a scalar use their buffers: equality on the UTF-8 bytes,
+        respectively one comparison per dictionary entry.
+
+        Returns
+        -------
+        numpy.ndarray of bool or XndframesArray
+            A NumPy array if no operand has missing values, otherwise an
+            array of type ``?bool`` that is missing wherever an operand is.
+        """
+        if self._buffers is not None and isinstance(other, six.string_types):
+            result = self._buffers.compare(op, other)
+            mask = self._get_null_mask()
+        else:
+            values, mask = self._values_and_mask()
+            other_values, other_mask = _operand(other, len(self))
+            mask = mask | other_mask
+            valid = slice(None)
+            if mask.any():
+                valid = ~mask
+                values = values[valid]
+                if np.ndim(other_values):
+                    other_values = other_values[valid]
+            result = np.zeros(len(self), dtype=bool)
+            with np.errstate(all="ignore"):
+                result[valid] = op(values, other_values)
+
+        if mask.any():
+            return type(self)(result, mask=mask)
+        return result
+
+    def _groupby_op(self, how, has_dropped_na=False, min_count=-1,
+                    ngroups=None, ids=None, **kwargs):
+        """
+        Grouped reduction, the ExtensionArray hook of pandas groupby.
+
+        ``sum``, ``mean``, ``min``, ``max``, ``first`` and ``last`` reduce
+        the exported values directly with the int64 group ``ids`` in one
+        pass; ``min``/``max`` of strings rank the string keys once. Other
+        operations are left to pandas, which computes ``count`` and
+        ``nunique`` without this hook.
+
+        Parameters
+        ----------
+        how : str
+            The name of the reduction.
+        has_dropped_na : bool
+            Whether rows with a missing key were dropped, i.e. have id -1.
+        min_count : int
+            Minimum number of valid values for ``sum``.
+        ngroups : int
+            The number of groups.
+        ids : numpy.ndarray of int
+            The group of each row, -1 for rows in no group.
+        **kwargs
+            ``skipna=False`` makes a group with a missing value missing.
+
+        Returns
+        -------
+        XndframesArray
+            One value per group. Sums of bool values are int64.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        if how not in ("sum", "mean", "min", "max", "first", "last"):
+            return super(XndframesArray, self)._groupby_op(
+                how=how, has_dropped_na=has_dropped_na, min_count=min_count,
+                ngroups=ngroups, ids=ids, **kwargs)
+
+        if how in ("first", "last"):
+            mask = self._get_null_mask()
+            if self.dtype.kind == "f":
+                mask = _with_nan(self._values_and_mask()[0], mask)
+            positions = _groupby.group_positions(mask, ids, ngroups, how)
+            return self.take(positions, allow_fill=True)
+
+        values, mask = self._values_and_mask()
+        mask = _with_nan(values, mask)
+        if values.dtype.kind not in "biuf":
+            if how not in ("min", "max"):
+                raise TypeError(
+                    "cannot perform {} with type {}".format(how, self.dtype))
+            keys, mask = self._sort_keys()
+            positions = _groupby.group_arg_extreme(
+                keys, mask, ids, ngroups, how)
+            return self.take(positions, allow_fill=True)
+
+        if values.dtype.kind == "b":
+            # counted as int64 by sum, as in pandas
+            values = values.view(np.uint8) if how in (
+                "min", "max") else values.astype(np.int64)
+        if how == "sum":
+            result, result_mask = _groupby.group_sum(
+                values, mask, ids, ngroups, min_count)
+        elif how == "mean":
+            result, result_mask = _groupby.group_mean(
+                values, mask, ids, ngroups)
+        else:
+            result, result_mask = _groupby.group_extreme(
+                values, mask, ids, ngroups, how)
+            if self.dtype.kind == "b":
+                result = result.view(bool)
+
+        if not kwargs.get("skipna", True):
+            missing = np.flatnonzero(mask & (ids >= 0))
+            result_mask = result_mask | (
+                np.bincount(ids.take(missing), minlength=ngroups) > 0)
+        return self._from_result(result, result_mask)
+
+
+XndframesArray._add_arithmetic_ops()
+XndframesArray._add_comparison_ops()
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+
+"""Joins of frames on XndframesArray key columns."""
+from __future__ import absolute_import, division, print_function
+
+import numpy as np
+import pandas as pd
+from pandas.api.extensions import take
+from pandas.core.arrays import ExtensionArray
+
+from .base import XndframesArray
+
+# Number of rows of the larger side matched at a time.
+_CHUNK_SIZE = 1 << 20
+
+_INT64_MAX = np.iinfo(np.int64).max
+
+_HOWS = ("inner", "left", "right", "outer")
+
+
+def _as_xnd_array(keys):
+    if isinstance(keys, (pd.Series, pd.Index)):
+        keys = keys.values
+    if isinstance(keys, XndframesArray):
+        return keys
+    # NumPy keys keep their fixed-width dtype; NaN and None are missing
+    keys = np.asarray(keys)
+    return XndframesArray(keys, mask=pd.isna(keys))
+
+
+def _key_codes(left_keys, right_keys):
+    """
+    Integer codes of the rows of both sides, equal exactly when all key
+    columns are equal. Missing values match each other, as in pandas.
+    Each key column is factorized once for both sides together, which
+    hashes fixed-width values, string bytes or dictionary codes.
+    """
+    left_codes = np.zeros(len(left_keys[0]), dtype=np.int64)
+    right_codes = np.zeros(len(right_keys[0]), dtype=np.int64)
+    size = 1
+    for left, right in zip(left_keys, right_keys):
+        left, right = _as_xnd_array(left), _as_xnd_array(right)
+        labels, uniques = XndframesArray._concat_same_type(
+            [left, right]).factorize()
+        # shift so that missing values get code 0
+        labels += 1
+        column_size = len(uniques) + 1
+
+        if size > _INT64_MAX // column_size:
+            codes, uniques = pd.factorize(
+                np.concatenate([left_codes, right_codes]))
+            left_codes = codes[:len(left_codes)]
+            right_codes = codes[len(left_codes):]
+            size = len(uniques)
+
+        left_codes = left_codes * column_size + labels[:len(left)]
+        right_codes = right_codes * column_size + labels[len(left):]
+        size *= column_size
+
+    return left_codes, right_codes
+
+
+def _match(build, probe):
+    """
+    All pairs of rows with equal codes, as ``(build_rows, probe_rows)``
+    ordered by probe row. The build side is sorted once; the probe side
+    is looked up in chunks so that the intermediate arrays stay bounded.
+    """
+    order = np.argsort(build, kind="stable")
+    sorted_build = build.take(order)
+
+    build_rows = [np.zeros(0, dtype=np.int64)]
+    probe_rows = [np.zeros(0, dtype=np.int64)]
+    for start in range(0, len(probe), _CHUNK_SIZE):
+        chunk = probe[start:start + _CHUNK_SIZE]
+        low = np.searchsorted(sorted_build, chunk, side="left")
+        counts = np.searchsorted(sorted_build, chunk, side="right") - low
+
+        # the matches of a probe row are consecutive in sorted_build
+        starts = np.repeat(low - (np.cumsum(counts) - counts), counts)
+        build_rows.append(order.take(starts + np.arange(counts.sum())))
+        probe_rows.append(
+            np.repeat(np.arange(start, start + len(chunk)), counts))
+
+    return (np.concatenate(build_rows).astype(np.int64, copy=False),
+            np.concatenate(probe_rows).astype(np.int64, copy=False))
+
+
+def _unmatched(rows, size):
+    """
+    The rows out of ``size`` that do not appear in ``rows``.
+    """
+    matched = np.zeros(size, dtype=bool)
+    matched[rows] = True
+    return np.flatnonzero(~matched)
+
+
+def join_indexers(left_keys, right_keys, how="inner"):
+    """
+    Compute the row indexers of a join.
+
+    The smaller side is sorted by its key codes and the larger side is
+    probed against it in chunks.
+
+    Parameters
+    ----------
+    left_keys, right_keys : list of array-like
+        The key columns of both sides, e.g. XndframesArray or Series.
+        Rows match when all their key columns are equal; missing values
+        match each other.
+    how : {'inner', 'left', 'right', 'outer'}, default 'inner'
+
+    Returns
+    -------
+    left_indexer, right_indexer : numpy.ndarray of int64
+        The rows of each side in the result, -1 where a side has no
+        matching row. Rows follow the order of the left side (of the
+        right side for ``how="right"``); the right-only rows of an outer
+        join come last. Both can be passed to ``take`` with
+        ``allow_fill=True``.
+    """
+    if how not in _HOWS:
+        raise ValueError("how must be one of {}, got {!r}".format(
+            ", ".join(_HOWS), how))
+    if len(left_keys) != len(right_keys) or not len(left_keys):
+        raise ValueError(
+            "left and right need the same, non-zero number of key columns")
+
+    left_codes, right_codes = _key_codes(left_keys, right_keys)
+    if len(left_codes) <= len(right_codes):
+        left_rows, right_rows = _match(left_codes, right_codes)
+    else:
+        right_rows, left_rows = _match(right_codes, left_codes)
+
+    left_parts, right_parts = [left_rows], [right_rows]
+    if how in ("left", "outer"):
+        extra = _unmatched(left_rows, len(left_codes))
+        left_parts.append(extra)
+        right_parts.append(np.full(len(extra), -1, dtype=np.int64))
+    if how in ("right", "outer"):
+        extra = _unmatched(right_rows, len(right_codes))
+        left_parts.append(np.full(len(extra), -1, dtype=np.int64))
+        right_parts.append(extra)
+
+    left_indexer = np.concatenate(left_parts)
+    right_indexer = np.concatenate(right_parts)
+    if how == "right":
+        order = np.argsort(right_indexer, kind="stable")
+    else:
+        order = np.argsort(
+            np.where(left_indexer < 0, len(left_codes), left_indexer),
+            kind="stable")
+    return left_indexer.take(order), right_indexer.take(order)
+
+
+def _take_column(column, indexer):
+    values = column.values
+    if isinstance(values, ExtensionArray):
+        return values.take(indexer, allow_fill=True)
+    return take(np.asarray(values), indexer, allow_fill=True)
+
+
+def merge(left, right, how="inner", on=None, left_on=None, right_on=None,
+          suffixes=("_x", "_y")):
+    """
+    Merge two DataFrames on key columns with ``join_indexers``.
+
+    Every column is gathered once with the indexers; XndframesArray
+    columns use their native ``take``.
+
+    Parameters
+    ----------
+    left, right : pandas.DataFrame
+    how : {'inner', 'left', 'right', 'outer'}, default 'inner'
+    on : label or list of labels, optional
+        Key columns present in both frames. They appear once in the
+        result, taken from the right side where the left has no row.
+    left_on, right_on : label or list of labels, optional
+        Key columns of each side, when they are named differently.
+    suffixes : tuple of (str, str), default ('_x', '_y')
+        Appended to other columns present in both frames.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    if on is not None:
+        left_on = right_on = on
+    if left_on is None or right_on is None:
+        raise ValueError("specify the key columns with on or left_on and "
+                         "right_on")
+    if not isinstance(left_on, list):
+        left_on = [left_on]
+    if not isinstance(right_on, list):
+        right_on = [right_on]
+
+    left_indexer, right_indexer = join_indexers(
+        [left[name] for name in left_on],
+        [right[name] for name in right_on],
+        how=how)
+
+    shared = set(left_on) if on is not None else set()
+    overlap = (set(left.columns) & set(right.columns)) - shared
+    missing_left = left_indexer < 0
+
+    columns = []
+    for name in left.columns:
+        values = _take_column(left[name], left_indexer)
+        if name in shared and missing_left.any():
+            other = _take_column(right[name], right_indexer)
+            if isinstance(values, XndframesArray):
+                values = values.where(~missing_left, other)
+            else:
+                values = np.where(missing_left, np.asarray(other), values)
+        label = "{}{}".format(name, suffixes[0]) if name in overlap else name
+        columns.append((label, values))
+    for name in right.columns:
+        if name in shared:
+            continue
+        label = "{}{}".format(name, suffixes[1]) if name in overlap else name
+        columns.append((label, _take_column(right[name], right_indexer)))
+
+    return pd.DataFrame(
+        {label: values for label, values in columns},
+        columns=[label for label, _ in columns])
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+
+"""Reading and writing Parquet files with XndframesArray columns.
+
+This module requires pyarrow.
+"""
+from __future__ import absolute_import, division, print_function
+
+import json
+
+import numpy as np
+import pandas as pd
+from ndtypes import ndt
+
+from ._dictionary import DictionaryBuffers
+from ._strings import StringBuffers
+from .base import XndframesArray, XndframesDtype, _as_option, _value_type
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+# Key of the schema metadata entry mapping column names to the names of
+# their XndframesDtype.
+_METADATA_KEY = b"xndframes"
+
+_fixed_width_types = {
+    "bool": "bool",
+    "int8": "int8",
+    "int16": "int16",
+    "int32": "int32",
+    "int64": "int64",
+    "uint8": "uint8",
+    "uint16": "uint16",
+    "uint32": "uint32",
+    "uint64": "uint64",
+    "float": "float32",
+    "double": "float64",
+}
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ImportError("reading and writing Parquet requires pyarrow")
+
+
+def _unpack_bits(buffer, offset, length):
+    """
+    Bool array from ``length`` bits of an Arrow bitmap, starting at bit
+    ``offset``.
+    """
+    bits = np.unpackbits(
+        np.frombuffer(buffer, dtype=np.uint8), bitorder="little")
+    return bits[offset:offset + length].astype(bool)
+
+
+def _pack_bits(values):
+    return pa.py_buffer(np.packbits(values, bitorder="little"))
+
+
+def _arrow_mask(array):
+    """
+    Missing-value mask of an Arrow array, from its validity bitmap.
+    """
+    validity = array.buffers()[0]
+    if validity is None or not array.null_count:
+        return np.zeros(len(array), dtype=bool)
+    return ~_unpack_bits(validity, array.offset, len(array))
+
+
+def _arrow_strings(array):
+    """
+    StringBuffers copied from an Arrow string or large_string array.
+    """
+    _, offsets, data = array.buffers()
+    dtype = np.int64 if pa.types.is_large_string(array.type) else np.int32
+    offsets = np.frombuffer(offsets, dtype=dtype)[
+        array.offset:array.offset + len(array) + 1]
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else \
+        np.zeros(0, dtype=np.uint8)
+    return StringBuffers(
+        offsets - offsets[0],
+        data[offsets[0]:offsets[-1]].copy(),
+        _arrow_mask(array))
+
+
+def _from_arrow(array, dtype):
+    """
+    XndframesArray from an Arrow array and the XndframesDtype recorded
+    for the column, if any. Returns None for unsupported Arrow types.
+    """
+    arrow_type = array.type
+    buffers, layout = None, None
+    if pa.types.is_dictionary(arrow_type):
+        if not pa.types.is_string(arrow_type.value_type):
+            return None
+        indices = array.indices
+        mask = _arrow_mask(indices)
+        codes = np.asarray(indices.to_numpy(zero_copy_only=False))
+        # Arrow does not require the dictionary to be free of duplicates
+        mapping, dictionary = _arrow_strings(array.dictionary).factorize()
+        if len(mapping):
+            codes = mapping.take(np.where(mask, 0, codes).astype(np.int64))
+        codes = np.where(mask, -1, codes).astype(np.int64)
+        buffers = DictionaryBuffers(codes, dictionary)
+        layout = "dictionary"
+    elif pa.types.is_string(arrow_type) or pa.types.is_large_string(
+            arrow_type):
+        buffers = _arrow_strings(array)
+        layout = "offsets"
+    elif str(arrow_type) in _fixed_width_types:
+        value_type = _fixed_width_types[str(arrow_type)]
+    else:
+        return None
+
+    mask = _arrow_mask(array) if buffers is None else buffers.mask
+    if dtype is None:
+        xnd_dtype = ndt("string" if buffers is not None else value_type)
+        if mask.any():
+            xnd_dtype = _as_option(xnd_dtype)
+        dtype = XndframesDtype(xnd_dtype, layout=layout)
+
+    if buffers is not None:
+        if dtype.layout is None:
+            return XndframesArray._from_values_and_mask(
+                buffers.to_values(), mask, dtype.xnd_dtype)
+        if layout == "dictionary" and dtype.layout == "offsets":
+            buffers = buffers.to_strings()
+        elif layout == "offsets" and dtype.layout == "dictionary":
+            buffers = DictionaryBuffers.encode(buffers)
+        return XndframesArray._from_buffers(buffers, dtype.xnd_dtype)
+
+    data = array.buffers()[1]
+    if value_type == "bool":
+        values = _unpack_bits(data, array.offset, len(array))
+    else:
+        values = np.frombuffer(data, dtype=value_type)[
+            array.offset:array.offset + len(array)].copy()
+    return XndframesArray._from_values_and_mask(values, mask, dtype.xnd_dtype)
+
+
+def _string_array(buffers):
+    """
+    Arrow string array sharing the memory of StringBuffers.
+    """
+    arrow_type = pa.string() if buffers.offsets.dtype == np.int32 \
+        else pa.large_string()
+    null_count = int(buffers.mask.sum())
+    validity = _pack_bits(~buffers.mask) if null_count else None
+    return pa.Array.from_buffers(
+        arrow_type, len(buffers),
+        [validity, pa.py_buffer(buffers.offsets), pa.py_buffer(buffers.data)],
+        null_count=null_count)
+
+
+def _to_arrow(array):
+    """
+    Arrow array with the values of an XndframesArray.
+    """
+    if isinstance(array._buffers, DictionaryBuffers):
+        codes = array._buffers.codes
+        return pa.DictionaryArray.from_arrays(
+            pa.array(codes, mask=codes < 0),
+            _string_array(array._buffers.dictionary))
+
+    value_type = _value_type(array.dtype.xnd_dtype)
+    if value_type == "string":
+        return _string_array(array._string_buffers())
+
+    arrow_types = {v: k for k, v in _fixed_width_types.items()}
+    if value_type not in arrow_types:
+        raise TypeError(
+            "cannot write {} to Parquet".format(array.dtype))
+    values, mask = array._values_and_mask()
+    return pa.array(
+        values, mask=mask if mask.any() else None,
+        type=pa.type_for_alias(arrow_types[value_type]))
+
+
+def to_parquet(df, path, **kwargs):
+    """
+    Write a DataFrame to a Parquet file.
+
+    XndframesArray columns are converted from their storage in bulk and
+    their XndframesDtype is recorded in the schema metadata, so that
+    ``read_parquet`` restores the exact element types and layouts. Other
+    columns are converted by pyarrow. The index is not written.
+
+    Parameters
+    ----------
+    df : pandas.DataFrame
+    path : str or file-like
+    **kwargs
+        Passed to :func:`pyarrow.parquet.write_table`, e.g.
+        ``row_group_size`` or ``compression``.
+    """
+    _require_pyarrow()
+    arrays, names, dtypes = [], [], {}
+    for name, column in df.items():
+        values = column.values
+        if isinstance(values, XndframesArray):
+            arrays.append(_to_arrow(values))
+            dtypes[str(name)] = str(values.dtype)
+        else:
+            arrays.append(pa.Array.from_pandas(column))
+        names.append(str(name))
+
+    table = pa.Table.from_arrays(arrays, names=names)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_METADATA_KEY] = json.dumps(dtypes).encode("utf-8")
+    pq.write_table(table.replace_schema_metadata(metadata), path, **kwargs)
+
+
+def read_parquet(path, columns=None, row_groups=None):
+    """
+    Read a Parquet file into a DataFrame of XndframesArray columns.
+
+    Columns written by ``to_parquet`` get back their XndframesDtype;
+    other columns get the xnd type of their Parquet type, an option type
+    if they have missing values, and strings the ``offsets`` layout.
+    Columns of unsupported types are converted by pyarrow.
+
+    String columns of the ``offsets`` and ``dictionary`` layouts and
+    fixed-width columns of a type without missing values are copied from
+    the column chunks in bulk. Fixed-width columns of an option type and
+    strings of the default layout are built through Python objects, as
+    is the dictionary of a column that is only encoded on reading.
+
+    Parameters
+    ----------
+    path : str or file-like
+    columns : list of str, optional
+        Read only these columns.
+    row_groups : list of int, optional
+        Read only these row groups.
+
+    Returns
+    -------
+    pandas.DataFrame
+    """
+    _require_pyarrow()
+    metadata = pq.read_schema(path).metadata or {}
+    dtypes = {
+        name: XndframesDtype.construct_from_string(dtype)
+        for name, dtype in json.loads(
+            metadata.get(_METADATA_KEY, b"{}").decode("utf-8")).items()}
+    dictionaries = [
+        name for name, dtype in dtypes.items()
+        if dtype.layout == "dictionary"
+        and (columns is None or name in columns)]
+
+    parquet_file = pq.ParquetFile(path, read_dictionary=dictionaries)
+    if row_groups is None:
+        table = parquet_file.read(columns=columns)
+    else:
+        table = parquet_file.read_row_groups(row_groups, columns=columns)
+
+    data = {}
+    for name in table.column_names:
+        chunked = table.column(name)
+        chunks = chunked.chunks or [pa.array([], type=chunked.type)]
+        parts = [_from_arrow(chunk, dtypes.get(name)) for chunk in chunks]
+        if any(part is None for part in parts):
+            data[name] = chunked.to_pandas()
+        elif len(parts) == 1:
+            data[name] = parts[0]
+        else:
+            # also unifies the dictionaries of dictionary-encoded chunks
+            data[name] = XndframesArray._concat_same_type(parts)
+    return pd.DataFrame(data, columns=table.column_names)
@@ -2,26 +2,507 @@
 
 from __future__ import absolute_import, division, print_function
 
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
 import pandas as pd
+import six
+from pandas.api.types import is_list_like
 
-from .base import XndframesArray
+from ._dictionary import DictionaryBuffers
+from ._strings import StringBuffers
+from .base import XndframesArray, _as_option, _scalars_to_numpy, _value_type
+
+
+# Number of strings decoded and matched at a time by the regex methods.
+_CHUNK_SIZE = 1 << 16
+
+
+@functools.lru_cache(maxsize=256)
+def _compile(pat, flags):
+    """
+    Compiled regular expression, cached across calls with LRU eviction.
+    """
+    return re.compile(pat, flags)
+
+
+def _apply_chunked(buffers, func, out, n_jobs=1):
+    """
+    Write ``func(value)`` for each valid value of ``buffers`` into ``out``.
+
+    The strings are decoded and processed in chunks of ``_CHUNK_SIZE``, so
+    only one chunk of Python strings is alive per worker. With ``n_jobs``
+    above 1 the chunks are spread over a thread pool.
+    """
+    def run(start):
+        chunk = buffers.rows(start, min(start + _CHUNK_SIZE, len(buffers)))
+        valid = np.flatnonzero(~chunk.mask)
+        values = chunk.to_values()[valid]
+        out[start + valid] = [func(value) for value in values]
+
+    starts = range(0, len(buffers), _CHUNK_SIZE)
+    if n_jobs > 1:
+        with ThreadPoolExecutor(max_workers=n_jobs) as pool:
+            list(pool.map(run, starts))
+    else:
+        for start in starts:
+            run(start)
+    return out
+
+
+def _fill_missing(buffers, na_rep):
+    """
+    StringBuffers with the missing values replaced by ``na_rep``.
+    """
+    valid = StringBuffers(
+        buffers.offsets, buffers.data, np.zeros(len(buffers), dtype=bool))
+    return StringBuffers.concat_rows([
+        valid,
+        StringBuffers.repeat(na_rep.encode("utf-8"), buffers.mask.astype(int)),
+    ])
 
 
 @pd.api.extensions.register_series_accessor("text")
 class TextAccessor:
+    """
+    String methods for Series backed by XndframesArray[string].
+
+    The methods run directly on the contiguous string buffers of the
+    column (see the ``offsets`` layout of ``XndframesDtype``); columns
+    with the default layout are encoded into such buffers once per
+    Series.
+    """
+
     def __init__(self, obj):
-        if not isinstance(obj.values, XndframesArray):
+        if not isinstance(obj.values, XndframesArray) or _value_type(
+                obj.values.dtype.xnd_dtype) != "string":
             raise AttributeError(
                 "only XndframesArray[string] has text accessor")
         self.obj = obj
-        self.data = self.obj.values.data
+        self.array = self.obj.values
+        self._buffers_cache = None
+
+    @property
+    def data(self):
+        return self.array.data
+
+    @property
+    def _buffers(self):
+        if self._buffers_cache is None:
+            self._buffers_cache = self.array._string_buffers()
+        return self._buffers_cache
 
     def startswith(self, needle, na=None):
-        pass
+        """
+        Test if the start of each string matches ``needle``.
+
+        Parameters
+        ----------
+        needle : str or tuple of str
+            The prefix, or several prefixes of which any may match.
+        na : object, optional
+            Result for missing values.
+
+        Returns
+        -------
+        numpy.ndarray of bool or XndframesArray
+            See ``_call_x_with``.
+        """
+        return self._call_x_with(StringBuffers.startswith, needle, na=na)
 
     def endswith(self, needle, na=None):
-        pass
+        """
+        Test if the end of each string matches ``needle``.
+
+        Parameters
+        ----------
+        needle : str or tuple of str
+            The suffix, or several suffixes of which any may match.
+        na : object, optional
+            Result for missing values.
+
+        Returns
+        -------
+        numpy.ndarray of bool or XndframesArray
+            See ``_call_x_with``.
+        """
+        return self._call_x_with(StringBuffers.endswith, needle, na=na)
+
+    def len(self):
+        """
+        Length of each string in characters.
+
+        Returns
+        -------
+        XndframesArray
+            ``int64``, or ``?int64`` if there are missing values.
+        """
+        return self._wrap_ints(self._buffers.char_lengths())
+
+    def lower(self):
+        """
+        Convert strings to lowercase.
+
+        Returns
+        -------
+        XndframesArray
+        """
+        return self._wrap_strings(self._buffers.lower())
+
+    def upper(self):
+        """
+        Convert strings to uppercase.
+
+        Returns
+        -------
+        XndframesArray
+        """
+        return self._wrap_strings(self._buffers.upper())
+
+    def strip(self, to_strip=None):
+        """
+        Remove leading and trailing characters.
+
+        Parameters
+        ----------
+        to_strip : str, optional
+            The characters to remove, whitespace by default.
+
+        Returns
+        -------
+        XndframesArray
+        """
+        return self._wrap_strings(self._buffers.strip(to_strip))
+
+    def lstrip(self, to_strip=None):
+        """
+        Remove leading characters, see ``strip``.
+        """
+        return self._wrap_strings(self._buffers.strip(to_strip, side="left"))
+
+    def rstrip(self, to_strip=None):
+        """
+        Remove trailing characters, see ``strip``.
+        """
+        return self._wrap_strings(self._buffers.strip(to_strip, side="right"))
+
+    def slice(self, start=None, stop=None, step=None):
+        """
+        Slice substrings by character positions.
+
+        Parameters
+        ----------
+        start, stop, step : int, optional
+            As for slicing a Python string.
+
+        Returns
+        -------
+        XndframesArray
+        """
+        return self._wrap_strings(self._buffers.slice(start, stop, step))
+
+    def contains(self, pat, na=None, regex=False, flags=0, n_jobs=1):
+        """
+        Test if ``pat`` is contained in each string.
+
+        Parameters
+        ----------
+        pat : str
+            A literal string, or a regular expression if ``regex``.
+        na : object, optional
+            Result for missing values.
+        regex : bool, default False
+            Whether ``pat`` is a regular expression.
+        flags : int, default 0
+            Flags for the ``re`` module.
+        n_jobs : int, default 1
+            Number of threads evaluating a regular expression.
+
+        Returns
+        -------
+        numpy.ndarray of bool or XndframesArray
+            See ``_call_x_with``.
+        """
+        if regex:
+            search = _compile(pat, flags).search
+            result = _apply_chunked(
+                self._buffers,
+                lambda value: search(value) is not None,
+                np.zeros(len(self._buffers), dtype=bool),
+                n_jobs)
+            return self._wrap_bool(result, na)
+
+        _, rows = self._buffers.occurrences(pat.encode("utf-8"))
+        if not pat:
+            rows = np.flatnonzero(~self._buffers.mask)
+        result = np.zeros(len(self._buffers), dtype=bool)
+        result[rows] = True
+        return self._wrap_bool(result, na)
+
+    def find(self, sub, start=0, end=None):
+        """
+        Lowest character index of the literal string ``sub`` in each
+        string, -1 where it is not found.
+
+        Parameters
+        ----------
+        sub : str
+        start, end : int, optional
+            Restrict the search to ``value[start:end]``.
+
+        Returns
+        -------
+        XndframesArray
+            ``int64``, or ``?int64`` if there are missing values.
+        """
+        return self._wrap_ints(self._buffers.find(sub, start, end))
+
+    def replace(self, pat, repl, n=-1, regex=False, flags=0, n_jobs=1):
+        """
+        Replace occurrences of ``pat`` by ``repl``.
+
+        Parameters
+        ----------
+        pat : str
+            A literal string, or a regular expression if ``regex``.
+        repl : str
+            The replacement; may refer to groups if ``regex``.
+        n : int, default -1
+            Maximum number of replacements per string, all if negative.
+        regex : bool, default False
+            Whether ``pat`` is a regular expression.
+        flags : int, default 0
+            Flags for the ``re`` module.
+        n_jobs : int, default 1
+            Number of threads evaluating a regular expression.
+
+        Returns
+        -------
+        XndframesArray
+        """
+        if not regex:
+            return self._wrap_strings(self._buffers.replace(pat, repl, n))
+
+        sub = _compile(pat, flags).sub
+        count = max(n, 0)
+        values = _apply_chunked(
+            self._buffers,
+            lambda value: sub(repl, value, count),
+            np.empty(len(self._buffers), dtype=object),
+            n_jobs)
+        mask = self._buffers.mask
+        return self._wrap_strings(StringBuffers.from_values(values, mask))
+
+    def match(self, pat, na=None, flags=0, n_jobs=1):
+        """
+        Test if each string starts with a match of the regular expression
+        ``pat``.
+
+        Parameters
+        ----------
+        pat : str
+        na : object, optional
+            Result for missing values.
+        flags : int, default 0
+            Flags for the ``re`` module.
+        n_jobs : int, default 1
+            Number of threads evaluating the regular expression.
+
+        Returns
+        -------
+        numpy.ndarray of bool or XndframesArray
+            See ``_call_x_with``.
+        """
+        match = _compile(pat, flags).match
+        result = _apply_chunked(
+            self._buffers,
+            lambda value: match(value) is not None,
+            np.zeros(len(self._buffers), dtype=bool),
+            n_jobs)
+        return self._wrap_bool(result, na)
+
+    def extract(self, pat, flags=0, expand=True, n_jobs=1):
+        """
+        Extract the groups of the first match of the regular expression
+        ``pat`` in each string.
+
+        Parameters
+        ----------
+        pat : str
+            A regular expression with at least one group.
+        flags : int, default 0
+            Flags for the ``re`` module.
+        expand : bool, default True
+            If False and ``pat`` has a single group, return that column
+            instead of a DataFrame.
+        n_jobs : int, default 1
+            Number of threads evaluating the regular expression.
+
+        Returns
+        -------
+        DataFrame or XndframesArray
+            One ``?string`` column per group, named by the group name or
+            number. Strings without a match give missing values.
+        """
+        regex = _compile(pat, flags)
+        if regex.groups == 0:
+            raise ValueError("pattern contains no capture groups")
+
+        matches = _apply_chunked(
+            self._buffers,
+            regex.search,
+            np.full(len(self._buffers), None, dtype=object),
+            n_jobs)
+
+        columns = []
+        for group in range(1, regex.groups + 1):
+            values = np.empty(len(matches), dtype=object)
+            values[:] = [None if m is None else m.group(group)
+                         for m in matches]
+            mask = values == None  # noqa: E711
+            columns.append(XndframesArray._from_values_and_mask(
+                values, mask, _as_option(self.array.dtype.xnd_dtype)))
+
+        if not expand and len(columns) == 1:
+            return columns[0]
+
+        names = dict((index, name) for name, index in regex.groupindex.items())
+        return pd.DataFrame(
+            dict((names.get(i + 1, i), column)
+                 for i, column in enumerate(columns)),
+            index=self.obj.index,
+            columns=[names.get(i + 1, i) for i in range(len(columns))])
+
+    def pad(self, width, side="left", fillchar=" "):
+        """
+        Pad strings to at least ``width`` characters.
+
+        Parameters
+        ----------
+        width : int
+        side : {"left", "right", "both"}, default "left"
+            Where to add the padding.
+        fillchar : str, default " "
+
+        Returns
+        -------
+        XndframesArray
+        """
+        return self._wrap_strings(self._buffers.pad(width, side, fillchar))
+
+    def cat(self, others=None, sep=None, na_rep=None):
+        """
+        Concatenate strings.
+
+        Parameters
+        ----------
+        others : list-like or list of list-likes, optional
+            Strings concatenated element-wise to this column. If None, the
+            values of this column are joined into a single string.
+        sep : str, default ""
+            Separator between the concatenated values.
+        na_rep : str, optional
+            Representation of missing values. If None, missing values are
+            skipped when joining the column and give missing results
+            otherwise.
+
+        Returns
+        -------
+        str or XndframesArray
+        """
+        sep = u"" if sep is None else sep
+        buffers = self._buffers
+        if na_rep is not None:
+            buffers = _fill_missing(buffers, na_rep)
+
+        if others is None:
+            buffers = buffers.compress(~buffers.mask)
+            counts = np.ones(len(buffers), dtype=np.int64)
+            counts[-1:] = 0
+            separators = StringBuffers.repeat(sep.encode("utf-8"), counts)
+            joined = StringBuffers.concat_rows([buffers, separators])
+            return joined.data.tobytes().decode("utf-8")
+
+        if not is_list_like(others):
+            raise TypeError("others must be list-like")
+        if isinstance(others, pd.Series):
+            others = [others]
+        elif not all(is_list_like(other) for other in others):
+            others = [others]
+
+        separator = StringBuffers.repeat(
+            sep.encode("utf-8"), np.ones(len(buffers), dtype=np.int64))
+        parts = [buffers]
+        for other in others:
+            other = self._other_buffers(other)
+            if na_rep is not None:
+                other = _fill_missing(other, na_rep)
+            parts.extend([separator, other])
+        return self._wrap_strings(StringBuffers.concat_rows(parts))
+
+    def _other_buffers(self, other):
+        if isinstance(other, pd.Series):
+            other = other.values
+        if isinstance(other, XndframesArray):
+            buffers = other._string_buffers()
+        else:
+            buffers = StringBuffers.from_values(*_scalars_to_numpy(other))
+        if len(buffers) != len(self._buffers):
+            raise ValueError(
+                "All arrays must be same length, got {} and {}".format(
+                    len(self._buffers), len(buffers)))
+        return buffers
+
+    def _wrap_strings(self, buffers):
+        """
+        XndframesArray of the strings in ``buffers``, with the layout of
+        the accessed column.
+        """
+        xnd_dtype = self.array.dtype.xnd_dtype
+        if buffers.mask.any():
+            xnd_dtype = _as_option(xnd_dtype)
+        layout = self.array.dtype.layout
+        if layout == "dictionary":
+            return XndframesArray._from_buffers(
+                DictionaryBuffers.encode(buffers), xnd_dtype)
+        if layout == "offsets":
+            return XndframesArray._from_buffers(buffers, xnd_dtype)
+        return XndframesArray._from_values_and_mask(
+            buffers.to_values(), buffers.mask, xnd_dtype)
+
+    def _wrap_ints(self, result):
+        return XndframesArray(result, mask=self._buffers.mask)
 
     def _call_x_with(self, impl, needle, na=None):
-        pass
+        """
+        Evaluate the StringBuffers predicate ``impl`` for all needles in
+        one pass over the string buffers.
+
+        Returns a boolean NumPy array where missing values are set to
+        ``na``. If ``na`` is None or NaN and there are missing values, an
+        XndframesArray of ``?bool`` marking them is returned instead.
+        """
+        if isinstance(needle, six.string_types):
+            needles = (needle,)
+        elif isinstance(needle, tuple) and all(
+                isinstance(n, six.string_types) for n in needle):
+            needles = needle
+        else:
+            raise TypeError(
+                "expected a string or tuple of strings, not {}".format(
+                    type(needle).__name__))
+
+        result = impl(
+            self._buffers, tuple(n.encode("utf-8") for n in needles))
+        return self._wrap_bool(result, na)
+
+    def _wrap_bool(self, result, na):
+        mask = self._buffers.mask
+        if not mask.any():
+            return result
+        if na is not None and not pd.isna(na):
+            result[mask] = bool(na)
+            return result
+        return XndframesArray(result, mask=mask)